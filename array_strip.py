@@ -0,0 +1,101 @@
+from manim import *
+import numpy as np
+from glyph_cache import cached_text
+
+
+class ArrayStrip(VGroup):
+    """列表可视化组件：一排方块 + 数值，可选正/负索引和变量名
+
+    子对象可通过属性访问：
+        squares         方块
+        numbers_text    方块中的数值
+        index_text      正向索引，从 index_start 开始编号（index_direction 为 None 时为空）
+        neg_index_text  负向索引（show_neg_index=False 时为空）
+        var_label       变量名标签（var_name 为 None 时为 None）
+    """
+    def __init__(
+        self,
+        data,
+        square_size=0.7,
+        cell_buff=0.02,
+        stroke_width=2,
+        stroke_color="#95A5A6",
+        font="SimSun",
+        font_size=24,
+        text_color="#000000",
+        value_colors=None,
+        index_direction=DOWN,
+        index_start=0,
+        index_buff=0.2,
+        index_font_size=20,
+        index_color="#3498DB",
+        show_neg_index=False,
+        neg_index_color="#E74C3C",
+        var_name=None,
+        var_font="Courier New",
+        var_font_size=28,
+        var_color="#9B59B6",
+        var_buff=0.3,
+        **kwargs
+    ):
+        super().__init__(**kwargs)
+        self.data = list(data)
+        n = len(self.data)
+
+        # 一次性计算所有方块中心位置
+        step = square_size + cell_buff
+        centers = np.outer(np.arange(n) * step, RIGHT)
+
+        self.squares = VGroup(*[
+            Square(
+                side_length=square_size,
+                stroke_width=stroke_width,
+                stroke_color=stroke_color
+            ).move_to(center)
+            for center in centers
+        ])
+
+        if value_colors is None:
+            value_colors = [text_color] * n
+        self.numbers_text = VGroup(*[
+            cached_text(str(value), font, font_size, color).move_to(center)
+            for value, color, center in zip(self.data, value_colors, centers)
+        ])
+
+        # 正向索引
+        self.index_text = VGroup()
+        if index_direction is not None:
+            for i, square in enumerate(self.squares):
+                self.index_text.add(
+                    cached_text(str(index_start + i), font, index_font_size, index_color)
+                    .next_to(square, index_direction, buff=index_buff)
+                )
+
+        # 负向索引（位于正向索引的另一侧）
+        self.neg_index_text = VGroup()
+        if show_neg_index:
+            neg_direction = UP if np.array_equal(index_direction, DOWN) else DOWN
+            for i, square in enumerate(self.squares):
+                self.neg_index_text.add(
+                    cached_text(str(i - n), font, index_font_size, neg_index_color)
+                    .next_to(square, neg_direction, buff=index_buff)
+                )
+
+        # 变量名（位于方块左侧）
+        self.var_label = None
+        if var_name is not None:
+            self.var_label = cached_text(f"{var_name} = ", var_font, var_font_size, var_color)
+            self.var_label.next_to(self.cells, LEFT, buff=var_buff)
+            self.add(self.var_label)
+
+        self.add(self.squares, self.numbers_text, self.index_text, self.neg_index_text)
+
+    @property
+    def cells(self):
+        """方块和数值（不含索引、变量名）"""
+        return VGroup(self.squares, self.numbers_text)
+
+    def move_cells_to(self, position):
+        """以方块和数值的中心为准移动整个组件"""
+        self.shift(position - self.cells.get_center())
+        return self
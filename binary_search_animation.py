@@ -1,5 +1,9 @@
 from manim import *
+from array_strip import ArrayStrip
+from search_trace import binary_search_trace
+from style_animations import BatchedStyle, StyleTarget, SetStroke
 import random
+import numpy as np
 
 class BinarySearchAnimation(Scene):
     def create_comparison_text(self, num1, num2, operation):
@@ -17,13 +21,11 @@ class BinarySearchAnimation(Scene):
             color=self.TEXT_COLOR
         )
 
-    def __init__(self):
-        super().__init__()
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
         # 设置背景颜色为浅灰色背景
         self.camera.background_color = "#FFFFFF"
         
-        # 创建水印
-        
         # 优化颜色方案
         self.TEXT_COLOR = "#000000"      # 深蓝灰色文字
         self.SQUARE_COLOR = "#95A5A6"     # 柔和的灰色方块边框
@@ -35,7 +37,20 @@ class BinarySearchAnimation(Scene):
         self.SCANNED_COLOR = "#9B59B6"    # 已扫描标记颜色（紫色）
         self.SKIPPED_COLOR = "#95A5A6"    # 已跳过标记颜色（灰色）
         
+        # 创建一个固定的有序数组，选择一个需要多次查找的目标值
+        #self.numbers = [3, 7, 12, 15, 18, 22, 26, 31, 35, 40, 44, 49, 53, 58, 62, 67]
+        #self.target = 62  # 选择靠后的数字，确保需要多次查找
+            # 创建一个更长的有序数组，选择一个位于中间偏后的值作为目标
+        self.numbers = [2, 5, 8, 13, 17, 22, 26, 31, 35, 39, 44, 48, 53, 57, 62, 66, 71, 75, 80, 85]
+        self.target = 53  # 选
         
+        # 设置方块属性
+        self.square_size = 0.7
+        self.stroke_width = 2
+
+    def setup(self):
+        """创建场景中的所有对象（渲染开始时由 manim 调用，构造场景对象时不会执行）"""
+        # 创建水印
         watermark = Text(
             "作者：温程远", 
             font="SimSun",
@@ -46,69 +61,34 @@ class BinarySearchAnimation(Scene):
         
         # 将水印添加到场景
         self.add(watermark)
-        # 创建一个固定的有序数组，选择一个需要多次查找的目标值
-        #self.numbers = [3, 7, 12, 15, 18, 22, 26, 31, 35, 40, 44, 49, 53, 58, 62, 67]
-        #self.target = 62  # 选择靠后的数字，确保需要多次查找
-            # 创建一个更长的有序数组，选择一个位于中间偏后的值作为目标
-        self.numbers = [2, 5, 8, 13, 17, 22, 26, 31, 35, 39, 44, 48, 53, 57, 62, 66, 71, 75, 80, 85]
-        self.target = 53  # 选
             # 创建标题
         self.title = Text("二分查找演示", font="SimSun", color=self.TEXT_COLOR).to_edge(UP, buff=0.3)
-        self.play(Write(self.title))
-        
-        # 创建数组可视化
-        self.squares = VGroup()
-        self.numbers_text = VGroup()
-        self.index_text = VGroup()
         
-        # 设置方块属性
-        self.square_size = 0.7
-        self.stroke_width = 2
-        
-        # 创建方块、数字和索引
-        for i, num in enumerate(self.numbers):
-            square = Square(
-                side_length=self.square_size,
-                stroke_width=self.stroke_width,
-                stroke_color=self.SQUARE_COLOR
-            ).shift(RIGHT * i * (self.square_size + self.stroke_width/100))
-            self.squares.add(square)
-            
-            # 如果当前数字等于目标值，则显示为红色
-            number_color = RED if num == self.target else self.TEXT_COLOR
-            number = Text(
-                str(num), 
-                font="SimSun", 
-                font_size=24, 
-                color=number_color
-            ).move_to(square.get_center())
-            self.numbers_text.add(number)
-            
-            index = Text(
-                str(i), 
-                font="SimSun", 
-                font_size=20, 
-                color=self.TEXT_COLOR
-            ).next_to(square, DOWN, buff=0.2)
-            self.index_text.add(index)
+        # 创建数组可视化（方块、数字和索引），目标值显示为红色
+        self.array_group = ArrayStrip(
+            self.numbers,
+            square_size=self.square_size,
+            cell_buff=self.stroke_width/100,
+            stroke_width=self.stroke_width,
+            stroke_color=self.SQUARE_COLOR,
+            font="SimSun",
+            font_size=24,
+            text_color=self.TEXT_COLOR,
+            value_colors=[RED if num == self.target else self.TEXT_COLOR for num in self.numbers],
+            index_color=self.TEXT_COLOR
+        )
+        self.squares = self.array_group.squares
+        self.numbers_text = self.array_group.numbers_text
+        self.index_text = self.array_group.index_text
         
-        self.array_group = VGroup(self.squares, self.numbers_text, self.index_text)
         self.array_group.move_to(ORIGIN + UP * 0.5)
         self.array_group.scale_to_fit_width(config.frame_width - 1)
         
-        self.play(
-            Create(self.squares),
-            Write(self.numbers_text),
-            Write(self.index_text)
-        )
-        
         self.target_text = VGroup(
             Text("查找目标值: ", font="SimSun", font_size=36, color=self.TEXT_COLOR),
             Text(str(self.target), font="SimSun", font_size=36, color=RED)
         ).arrange(RIGHT, buff=0.1).next_to(self.title, DOWN, buff=0.3)
         
-        self.play(Write(self.target_text))
-        
         # 创建指针，调整位置使它们不会完全重叠
         self.arrow_config = {
             "stroke_width": 4,
@@ -117,30 +97,15 @@ class BinarySearchAnimation(Scene):
             "tip_length": 0.2
         }
         
-        def create_pointer(color, index, offset=0):
-            return Arrow(
-                start=DOWN * 0.4 + RIGHT * offset,
-                end=UP * 0.4 + RIGHT * offset,
-                color=color,
-                **self.arrow_config
-            ).next_to(self.squares[index], DOWN, buff=0.7)
-        
-        self.pointer_low = create_pointer(self.LOW_COLOR, 0, -0.15)
-        self.pointer_high = create_pointer(self.HIGH_COLOR, -1, 0.15)
-        self.pointer_mid = create_pointer(self.MID_COLOR, 0)
+        self.pointer_low = self.create_pointer(self.LOW_COLOR, 0, -0.15)
+        self.pointer_high = self.create_pointer(self.HIGH_COLOR, -1, 0.15)
+        self.pointer_mid = self.create_pointer(self.MID_COLOR, 0)
         
         # 创建标签文字，水平错开
         self.label_low = Text("low", font="SimSun", color=self.LOW_COLOR, font_size=24).next_to(self.pointer_low, DOWN, buff=0.1).shift(LEFT * 0.15)
         self.label_high = Text("high", font="SimSun", color=self.HIGH_COLOR, font_size=24).next_to(self.pointer_high, DOWN, buff=0.1).shift(RIGHT * 0.15)
         self.label_mid = Text("mid", font="SimSun", color=self.MID_COLOR, font_size=24).next_to(self.pointer_mid, DOWN, buff=0.1)
         
-        self.play(
-            Create(self.pointer_low),
-            Create(self.pointer_high),
-            Write(self.label_low),
-            Write(self.label_high)
-        )
-        
         self.left, self.right = 0, len(self.numbers) - 1
         
         # 添加用于存储已检查和已跳过元素的标记
@@ -175,78 +140,110 @@ class BinarySearchAnimation(Scene):
             ).move_to(square.get_center())
             self.skipped_marks.add(skipped)
 
+    def create_pointer(self, color, index, offset=0):
+        """创建指向某个方块的指针箭头"""
+        return Arrow(
+            start=DOWN * 0.4 + RIGHT * offset,
+            end=UP * 0.4 + RIGHT * offset,
+            color=color,
+            **self.arrow_config
+        ).next_to(self.squares[index], DOWN, buff=0.7)
+
     def mark_scanned(self, index):
         """标记已扫描的元素"""
-        return AnimationGroup(
-            self.squares[index].animate.set_stroke(opacity=0.6),
-            self.numbers_text[index].animate.set_opacity(0.6),
-            self.index_text[index].animate.set_opacity(0.6),
-            self.scanned_marks[index].animate.set_opacity(1),
+        return BatchedStyle(
+            StyleTarget(self.squares[index], stroke_opacity=0.6),
+            StyleTarget(self.numbers_text[index], fill_opacity=0.6, stroke_opacity=0.6),
+            StyleTarget(self.index_text[index], fill_opacity=0.6, stroke_opacity=0.6),
+            StyleTarget(self.scanned_marks[index], fill_opacity=1, stroke_opacity=1),
             lag_ratio=0.1
         )
 
     def mark_skipped_range(self, start, end):
-        """标记被跳过的范围"""
-        animations = []
-        for i in range(start, end + 1):
-            animations.extend([
-                self.squares[i].animate.set_stroke(opacity=0.3),
-                self.numbers_text[i].animate.set_opacity(0.3),
-                self.index_text[i].animate.set_opacity(0.3),
-                self.skipped_marks[i].animate.set_fill_opacity(0.3)
-            ])
-        return animations
+        """标记被跳过的范围（整个范围合并为一个批量动画）"""
+        span = slice(start, end + 1)
+        return BatchedStyle(
+            StyleTarget(self.squares[span], stroke_opacity=0.3),
+            StyleTarget(self.numbers_text[span], fill_opacity=0.3, stroke_opacity=0.3),
+            StyleTarget(self.index_text[span], fill_opacity=0.3, stroke_opacity=0.3),
+            StyleTarget(self.skipped_marks[span], fill_opacity=0.3)
+        )
 
     def construct(self):
-        while self.left <= self.right:
-            mid = (self.left + self.right) // 2
+        # 开场：标题、数组、目标值和 low/high 指针
+        self.next_section("开场")
+        self.play(Write(self.title))
+        
+        self.play(
+            Create(self.squares),
+            Write(self.numbers_text),
+            Write(self.index_text)
+        )
+        
+        self.play(Write(self.target_text))
+        
+        self.play(
+            Create(self.pointer_low),
+            Create(self.pointer_high),
+            Write(self.label_low),
+            Write(self.label_high)
+        )
+        
+        # 按照算法轨迹逐步播放动画，每一轮分为 计算mid / 比较 / 缩小范围 三个小节
+        round_number = 0
+        for event in binary_search_trace(self.numbers, self.target):
+            if event.kind == "mid":
+                round_number += 1
+                self.next_section(f"第{round_number}轮-计算mid")
+                self.left, mid, self.right = event.low, event.mid, event.high
 
-            # 更新指针指向方块的颜色
-            self.play(
-                self.squares[self.left].animate.set_stroke(color=self.LOW_COLOR),
-                self.squares[self.right].animate.set_stroke(color=self.HIGH_COLOR)
-            )
-            
-            # 更新mid指针位置
-            self.pointer_mid.next_to(self.squares[mid], DOWN, buff=0.7)
-            self.label_mid.next_to(self.squares[mid], DOWN, buff=1.2)
-            
-            # 显示计算过程
-            calc_text = Text(
-                f"mid = (low + high) // 2 = ({self.left} + {self.right}) // 2 = {mid}", 
-                font="SimSun", 
-                font_size=32,
-                color=self.TEXT_COLOR
-            ).next_to(self.target_text, DOWN, buff=0.4)
-            
-            self.play(
-                Create(self.pointer_mid),
-                Write(self.label_mid),
-                Write(calc_text)
-            )
-            
-            # 高亮当前元素
-            self.play(self.squares[mid].animate.set_stroke(color=self.MID_COLOR))
-            
-            comparison_text = self.create_comparison_text(
-                f"list[{mid}]", 
-                str(self.target),
-                "==" if self.numbers[mid] == self.target else ("<" if self.numbers[mid] < self.target else ">")
-            ).next_to(calc_text, DOWN, buff=2).shift(DOWN*1)
-            
-            self.play(Write(comparison_text))
+                # 更新指针指向方块的颜色
+                self.play(
+                    SetStroke(self.squares[self.left], color=self.LOW_COLOR),
+                    SetStroke(self.squares[self.right], color=self.HIGH_COLOR)
+                )
+                
+                # 更新mid指针位置
+                self.pointer_mid.next_to(self.squares[mid], DOWN, buff=0.7)
+                self.label_mid.next_to(self.squares[mid], DOWN, buff=1.2)
+                
+                # 显示计算过程
+                calc_text = Text(
+                    f"mid = (low + high) // 2 = ({self.left} + {self.right}) // 2 = {mid}", 
+                    font="SimSun", 
+                    font_size=32,
+                    color=self.TEXT_COLOR
+                ).next_to(self.target_text, DOWN, buff=0.4)
+                
+                self.play(
+                    Create(self.pointer_mid),
+                    Write(self.label_mid),
+                    Write(calc_text)
+                )
+                
+                # 高亮当前元素
+                self.play(SetStroke(self.squares[mid], color=self.MID_COLOR))
+
+            elif event.kind == "compare":
+                self.next_section(f"第{round_number}轮-比较")
+                comparison_text = self.create_comparison_text(
+                    f"list[{mid}]", 
+                    str(self.target),
+                    event.op
+                ).next_to(calc_text, DOWN, buff=2).shift(DOWN*1)
+                
+                self.play(Write(comparison_text))
             
-            if self.numbers[mid] == self.target:
+            elif event.kind == "found":
                 reasoning = self.create_reasoning_text(
                     f"目标值位于索引 {mid}"
                 ).next_to(comparison_text, DOWN, buff=0.3)
                 
                 self.play(Write(reasoning))
-                break
                 
-            elif self.numbers[mid] < self.target:
+            elif event.kind == "move_low":
                 reasoning = self.create_reasoning_text(
-                    f"更新 low = mid + 1 = {mid + 1}"
+                    f"更新 low = mid + 1 = {event.low}"
                 ).next_to(comparison_text, DOWN, buff=0.3)
                 
                 self.play(Write(reasoning))
@@ -254,11 +251,11 @@ class BinarySearchAnimation(Scene):
                 # 标记当前检查的元素为已扫描
                 self.play(self.mark_scanned(mid))
                 
+                self.next_section(f"第{round_number}轮-缩小范围")
                 # 标记左半部分为已跳过
-                exclude_animations = self.mark_skipped_range(self.left, mid-1)
-                self.play(*exclude_animations)
+                self.play(self.mark_skipped_range(self.left, mid-1))
                 
-                self.left = mid + 1
+                self.left = event.low
                 self.play(
                     AnimationGroup(
                         self.pointer_low.animate.next_to(self.squares[self.left], DOWN, buff=0.7).shift(LEFT * 0.2 + DOWN * 0.3),
@@ -270,9 +267,14 @@ class BinarySearchAnimation(Scene):
                     )
                 )
                 
-            else:
+                self.play(
+                    FadeOut(self.pointer_mid),
+                    FadeOut(self.label_mid)
+                )
+                
+            elif event.kind == "move_high":
                 reasoning = self.create_reasoning_text(
-                    f"更新 high = mid - 1 = {mid - 1}"
+                    f"更新 high = mid - 1 = {event.high}"
                 ).next_to(comparison_text, DOWN, buff=0.3)
                 
                 self.play(Write(reasoning))
@@ -280,11 +282,11 @@ class BinarySearchAnimation(Scene):
                 # 标记当前检查的元素为已扫描
                 self.play(self.mark_scanned(mid))
                 
+                self.next_section(f"第{round_number}轮-缩小范围")
                 # 标记右半部分为已跳过
-                exclude_animations = self.mark_skipped_range(mid+1, self.right)
-                self.play(*exclude_animations)
+                self.play(self.mark_skipped_range(mid+1, self.right))
                 
-                self.right = mid - 1
+                self.right = event.high
                 self.play(
                     AnimationGroup(
                         self.pointer_high.animate.next_to(self.squares[self.right], DOWN, buff=0.7).shift(RIGHT * 0.2 + UP * 0.3),
@@ -295,12 +297,286 @@ class BinarySearchAnimation(Scene):
                         lag_ratio=0.1
                     )
                 )
-            
-            self.play(
-                FadeOut(self.pointer_mid),
-                FadeOut(self.label_mid)
+                
+                self.play(
+                    FadeOut(self.pointer_mid),
+                    FadeOut(self.label_mid)
+                )
+
+        self.next_section("结束")
+        self.wait(2)
+
+class LargeBinarySearchAnimation(Scene):
+    """大数组二分查找演示（10^3 ~ 10^6 个元素）
+
+    只为 low/mid/high 附近的少量元素绘制完整的方块、数字和索引，
+    整个数组用一条压缩的区间条表示，当前查找范围以阴影显示并每轮减半。
+    场景中的对象数量与数组长度无关。
+
+    numbers 为要查找的有序数组（列表或 NumPy 数组），target 为目标值；
+    不传 numbers 时生成 ARRAY_SIZE（或 array_size）个等差数列元素，
+    不传 target 时取数组中约 62% 位置的元素。
+    """
+    ARRAY_SIZE = 1000000
+    POINTER_RADIUS = 1   # low/high 左右各显示的元素个数
+    MID_RADIUS = 2       # mid 左右各显示的元素个数
+
+    def __init__(self, numbers=None, target=None, array_size=None, **kwargs):
+        super().__init__(**kwargs)
+        self.camera.background_color = "#FFFFFF"
+
+        # 与 BinarySearchAnimation 相同的颜色方案
+        self.TEXT_COLOR = "#000000"
+        self.SQUARE_COLOR = "#95A5A6"
+        self.LOW_COLOR = "#3498DB"
+        self.HIGH_COLOR = "#E67E22"
+        self.MID_COLOR = "#9B59B6"
+        self.HIGHLIGHT_COLOR = "#2ECC71"
+        self.SKIPPED_COLOR = "#95A5A6"
+
+        # 有序数组只以 NumPy 数组形式存在，不为每个元素创建对象
+        if numbers is None:
+            n = array_size or self.ARRAY_SIZE
+            self.numbers = np.arange(n, dtype=np.int64) * 3 + 2
+        else:
+            self.numbers = np.asarray(numbers)
+            if self.numbers.ndim != 1 or len(self.numbers) == 0:
+                raise ValueError("numbers 必须是非空的一维数组")
+            if np.any(self.numbers[1:] < self.numbers[:-1]):
+                raise ValueError("二分查找要求 numbers 按升序排列")
+        n = len(self.numbers)
+        self.target = self.numbers[int(n * 0.62)].item() if target is None else target
+
+    def setup(self):
+        """创建水印、标题、区间条和指针"""
+        watermark = Text(
+            "作者：温程远",
+            font="SimSun",
+            color=self.TEXT_COLOR,
+            font_size=24
+        ).to_corner(DR, buff=0.3)
+        watermark.set_opacity(0.3)
+        self.add(watermark)
+
+        n = len(self.numbers)
+        self.title = Text("大数组二分查找演示", font="SimSun", color=self.TEXT_COLOR).to_edge(UP, buff=0.3)
+        self.target_text = VGroup(
+            Text("查找目标值: ", font="SimSun", font_size=36, color=self.TEXT_COLOR),
+            Text(str(self.target), font="SimSun", font_size=36, color=RED),
+            Text(f"（n = {n:,}）", font="SimSun", font_size=28, color=self.TEXT_COLOR)
+        ).arrange(RIGHT, buff=0.1).next_to(self.title, DOWN, buff=0.3)
+
+        # 整个数组压缩成一条区间条
+        self.bar = Rectangle(
+            width=config.frame_width - 1.5,
+            height=0.35,
+            stroke_color=self.SQUARE_COLOR,
+            stroke_width=2,
+            fill_color=self.SKIPPED_COLOR,
+            fill_opacity=0.3
+        ).move_to(UP * 0.9)
+        self.bar_labels = VGroup(
+            Text("0", font="SimSun", font_size=20, color=self.TEXT_COLOR).next_to(self.bar.get_corner(DL), DOWN, buff=0.1),
+            Text(str(n - 1), font="SimSun", font_size=20, color=self.TEXT_COLOR).next_to(self.bar.get_corner(DR), DOWN, buff=0.1)
+        )
+        self.active_span = self.create_span(0, n - 1)
+
+        self.pointer_low = self.create_bar_pointer(self.LOW_COLOR, "low", 0)
+        self.pointer_high = self.create_bar_pointer(self.HIGH_COLOR, "high", n - 1)
+        self.pointer_mid = self.create_bar_pointer(self.MID_COLOR, "mid", (n - 1) // 2)
+
+        self.left, self.right = 0, n - 1
+
+    def index_to_x(self, index):
+        """把数组索引映射到区间条上的横坐标（元素的左边缘）"""
+        return self.bar.get_left()[0] + index / len(self.numbers) * self.bar.width
+
+    def create_span(self, low, high):
+        """区间条上表示当前查找范围 [low, high] 的阴影"""
+        left = self.index_to_x(low)
+        right = self.index_to_x(high + 1)
+        width = max(right - left, 0.03)
+        return Rectangle(
+            width=width,
+            height=self.bar.height,
+            stroke_width=0,
+            fill_color=self.HIGHLIGHT_COLOR,
+            fill_opacity=0.5
+        ).move_to([left + width / 2, self.bar.get_center()[1], 0])
+
+    def create_bar_pointer(self, color, label, index):
+        """区间条上方指向某个索引的指针（箭头 + 标签）"""
+        arrow = Arrow(
+            start=UP * 0.5,
+            end=ORIGIN,
+            color=color,
+            buff=0,
+            stroke_width=4,
+            max_tip_length_to_length_ratio=0.4,
+            tip_length=0.15
+        )
+        text = Text(label, font="SimSun", color=color, font_size=20).next_to(arrow, UP, buff=0.05)
+        pointer = VGroup(arrow, text)
+        self.place_bar_pointer(pointer, index)
+        return pointer
+
+    def place_bar_pointer(self, pointer, index):
+        """把指针移动到索引 index 上方"""
+        x = (self.index_to_x(index) + self.index_to_x(index + 1)) / 2
+        pointer.shift([x - pointer[0].get_end()[0], self.bar.get_top()[1] - pointer[0].get_end()[1], 0])
+        return pointer
+
+    def detail_runs(self, low, mid, high):
+        """需要完整绘制的元素索引，按连续区间分组返回 [(start, stop), ...]"""
+        n = len(self.numbers)
+        wanted = set()
+        for center, radius in ((low, self.POINTER_RADIUS), (mid, self.MID_RADIUS), (high, self.POINTER_RADIUS)):
+            wanted.update(range(max(0, center - radius), min(n, center + radius + 1)))
+
+        runs = []
+        for index in sorted(wanted):
+            if runs and runs[-1][1] == index:
+                runs[-1][1] = index + 1
+            else:
+                runs.append([index, index + 1])
+        return [tuple(run) for run in runs]
+
+    def create_detail_window(self, low, mid, high):
+        """在区间条下方绘制 low/mid/high 附近元素的细节，以及指向区间条的缩放线"""
+        pieces = VGroup()
+        runs = self.detail_runs(low, mid, high)
+        for run_idx, (start, stop) in enumerate(runs):
+            if run_idx > 0:
+                pieces.add(Text("…", font="SimSun", font_size=32, color=self.TEXT_COLOR))
+
+            values = self.numbers[start:stop]
+            strip = ArrayStrip(
+                [v.item() for v in values],
+                square_size=1.1,
+                stroke_color=self.SQUARE_COLOR,
+                font="SimSun",
+                font_size=18,
+                text_color=self.TEXT_COLOR,
+                value_colors=[RED if v == self.target else self.TEXT_COLOR for v in values],
+                index_start=start,
+                index_font_size=16,
+                index_color=self.TEXT_COLOR
             )
+            for offset, index in enumerate(range(start, stop)):
+                square = strip.squares[offset]
+                if index == mid:
+                    square.set_stroke(color=self.MID_COLOR, width=4)
+                elif index == low:
+                    square.set_stroke(color=self.LOW_COLOR, width=4)
+                elif index == high:
+                    square.set_stroke(color=self.HIGH_COLOR, width=4)
+                elif index < low or index > high:
+                    # 已排除的元素
+                    square.set_fill(self.SKIPPED_COLOR, opacity=0.3)
+                    strip.numbers_text[offset].set_opacity(0.3)
+                    strip.index_text[offset].set_opacity(0.3)
+            pieces.add(strip)
+
+        pieces.arrange(RIGHT, buff=0.3)
+        if pieces.width > config.frame_width - 1:
+            pieces.scale_to_fit_width(config.frame_width - 1)
+        pieces.move_to(DOWN * 1.2)
+
+        # 缩放线：连接区间条上的位置和对应的细节方块
+        zoom_lines = VGroup()
+        for piece, (start, stop) in zip(pieces[::2], runs):
+            for index, corner in ((start, piece.squares[0].get_corner(UL)), (stop, piece.squares[-1].get_corner(UR))):
+                zoom_lines.add(DashedLine(
+                    [self.index_to_x(index), self.bar.get_bottom()[1], 0],
+                    corner,
+                    color=self.SQUARE_COLOR,
+                    stroke_width=1.5
+                ))
+        return VGroup(pieces, zoom_lines)
+
+    def construct(self):
+        n = len(self.numbers)
+
+        self.next_section("开场")
+        self.play(Write(self.title))
+        self.play(Write(self.target_text))
+        self.play(
+            Create(self.bar),
+            FadeIn(self.active_span),
+            Write(self.bar_labels)
+        )
+        self.play(FadeIn(self.pointer_low), FadeIn(self.pointer_high))
+
+        detail = None
+        steps = 0
+        max_steps = int(np.ceil(np.log2(n + 1)))
+        for event in binary_search_trace(self.numbers, self.target):
+            if event.kind == "mid":
+                self.left, mid, self.right = event.low, event.mid, event.high
+                steps += 1
+                self.next_section(f"第{steps}次比较")
+
+                # 更新 mid 指针和细节窗口
+                self.place_bar_pointer(self.pointer_mid, mid)
+                new_detail = self.create_detail_window(self.left, mid, self.right)
+                calc_text = Text(
+                    f"第 {steps} 次比较（最多 {max_steps} 次）：mid = ({self.left} + {self.right}) // 2 = {mid}",
+                    font="SimSun",
+                    font_size=28,
+                    color=self.TEXT_COLOR
+                ).next_to(self.target_text, DOWN, buff=0.3)
+
+                if detail is None:
+                    self.play(FadeIn(new_detail), FadeIn(self.pointer_mid), Write(calc_text))
+                else:
+                    self.play(FadeOut(detail), FadeIn(new_detail), FadeIn(self.pointer_mid), Write(calc_text))
+                detail = new_detail
+
+            elif event.kind == "compare":
+                comparison_text = VGroup(
+                    Text(f"list[{mid}] = {event.value} {event.op} ", font="SimSun", font_size=28, color=self.TEXT_COLOR),
+                    Text(str(self.target), font="SimSun", font_size=28, color=RED)
+                ).arrange(RIGHT, buff=0.1).to_edge(DOWN, buff=1.2)
+                self.play(Write(comparison_text))
+
+            elif event.kind == "found":
+                reasoning = Text(
+                    f"找到目标值！位于索引 {mid}，共比较 {steps} 次",
+                    font="SimSun",
+                    font_size=28,
+                    color=self.HIGHLIGHT_COLOR
+                ).next_to(comparison_text, DOWN, buff=0.3)
+                self.play(Write(reasoning))
+
+            elif event.kind in ("move_low", "move_high"):
+                self.left, self.right = event.low, event.high
+                if event.kind == "move_low":
+                    reasoning_str = f"更新 low = mid + 1 = {self.left}"
+                else:
+                    reasoning_str = f"更新 high = mid - 1 = {self.right}"
+                reasoning = Text(reasoning_str, font="SimSun", font_size=28, color=self.TEXT_COLOR).next_to(comparison_text, DOWN, buff=0.3)
+                self.play(Write(reasoning))
+
+                # 阴影范围减半，low/high 指针移动
+                self.play(
+                    Transform(self.active_span, self.create_span(min(self.left, n - 1), max(min(self.left, n - 1), self.right))),
+                    self.pointer_low.animate.become(self.place_bar_pointer(self.pointer_low.copy(), self.left)),
+                    self.pointer_high.animate.become(self.place_bar_pointer(self.pointer_high.copy(), self.right)),
+                    FadeOut(self.pointer_mid)
+                )
+                self.play(FadeOut(calc_text), FadeOut(comparison_text), FadeOut(reasoning))
+
+            elif event.kind == "not_found":
+                # 自定义 target 可能不在数组中
+                reasoning = Text(
+                    f"low > high，数组中没有目标值，共比较 {steps} 次",
+                    font="SimSun",
+                    font_size=28,
+                    color=RED
+                ).to_edge(DOWN, buff=1.2)
+                self.play(FadeOut(detail), Write(reasoning))
 
+        self.next_section("结束")
         self.wait(2)
 
 if __name__ == "__main__":
@@ -308,7 +584,7 @@ if __name__ == "__main__":
     config.pixel_width = 3840
     config.frame_rate = 30
     
-    with tempconfig({"quality": "production_quality", "preview": True}):
+    with tempconfig({"quality": "production_quality", "preview": True, "save_sections": True}):
         scene = BinarySearchAnimation()
         scene.render()
 
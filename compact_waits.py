@@ -0,0 +1,126 @@
+"""
+静态停顿只编码一帧
+
+self.wait() 期间画面不变时，manim 仍会把同一帧重复编码 wait 时长 × 帧率 次
+（4K 下每秒 30 张完全相同的帧）。启用后：
+    1. 渲染时每个静态停顿只写入一帧，并记录停顿时长；
+    2. 渲染结束后用 ffmpeg concat 列表的 duration 指令重新拼接完整视频和各小节视频
+       （直接复制码流），停顿的那一帧一直显示到下一个片段开始，即可变帧率输出。
+视频末尾的停顿没有“下一个片段”，这一个停顿会单独补足为完整时长。
+
+输出为可变帧率视频，按帧序号换算时间的工具（如 extract_video.py）需注意。
+由 render_all.py --compact-waits 使用。
+"""
+import json
+import os
+import subprocess
+import tempfile
+
+
+class HoldRecorder:
+    """替换渲染器的 freeze_current_frame，记录每个停顿片段的时长"""
+    def __init__(self, scene):
+        self.renderer = scene.renderer
+        self.holds = {}  # 片段文件路径 -> 停顿时长（秒）
+        self._original_freeze = self.renderer.freeze_current_frame
+        self.renderer.freeze_current_frame = self.freeze_current_frame
+
+    def freeze_current_frame(self, duration):
+        renderer = self.renderer
+        dt = 1 / renderer.camera.frame_rate
+        num_frames = int(duration / dt)
+        if renderer.skip_animations or num_frames <= 1:
+            return self._original_freeze(duration)
+
+        # 只写一帧，场景时间仍按完整时长推进
+        renderer.add_frame(renderer.get_frame())
+        renderer.time += (num_frames - 1) * dt
+        self.holds[str(renderer.file_writer.partial_movie_files[-1])] = num_frames * dt
+
+
+# 与 manim 片段视频相同的编码参数（libx264、yuv420p、CRF 23），补足后的片段才能与其他片段直接复制码流拼接
+PARTIAL_ENCODE_ARGS = ["-c:v", "libx264", "-pix_fmt", "yuv420p", "-crf", "23"]
+
+
+def _expand_hold(path, duration):
+    """把只有一帧的停顿片段补足为完整时长（只用于视频末尾的停顿）
+
+    片段名 uncached_NNNNN 每次渲染都会被覆盖，所以每次都重新生成，不复用上一次的结果。
+    """
+    expanded = os.path.splitext(path)[0] + "_full.mp4"
+    subprocess.run(
+        ["ffmpeg", "-y", "-v", "error", "-i", path,
+         "-vf", f"tpad=stop_mode=clone:stop_duration={duration:.6f}", "-t", f"{duration:.6f}",
+         *PARTIAL_ENCODE_ARGS, expanded],
+        check=True
+    )
+    return expanded
+
+
+def concat_with_holds(partial_files, holds, output_path):
+    """按 concat 列表拼接片段，停顿片段使用 duration 指令，不重新编码"""
+    partial_files = [str(path) for path in partial_files if path is not None]
+    if not partial_files:
+        return
+
+    last = partial_files[-1]
+    if last in holds:
+        partial_files[-1] = _expand_hold(last, holds[last])
+
+    fd, list_path = tempfile.mkstemp(suffix=".txt", text=True)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            for path in partial_files:
+                escaped = os.path.abspath(path).replace("\\", "/").replace("'", "'\\''")
+                f.write(f"file '{escaped}'\n")
+                if path in holds:
+                    f.write(f"duration {holds[path]:.6f}\n")
+        tmp_output = output_path + ".tmp.mp4"
+        subprocess.run(
+            ["ffmpeg", "-y", "-v", "error", "-f", "concat", "-safe", "0", "-i", list_path,
+             "-c", "copy", "-movflags", "+faststart", tmp_output],
+            check=True
+        )
+        os.replace(tmp_output, output_path)
+    finally:
+        os.remove(list_path)
+
+
+def _video_duration(video_path):
+    result = subprocess.run(
+        ["ffprobe", "-v", "error", "-show_entries", "format=duration", "-of", "json", video_path],
+        capture_output=True, text=True, check=True
+    )
+    return float(json.loads(result.stdout)["format"]["duration"])
+
+
+def rewrite_outputs(scene, recorder):
+    """渲染结束后重新拼接完整视频和各小节视频，返回节省的帧数"""
+    if not recorder.holds:
+        return 0
+    file_writer = scene.renderer.file_writer
+    concat_with_holds(file_writer.partial_movie_files, recorder.holds, str(file_writer.movie_file_path))
+
+    sections_dir = getattr(file_writer, "sections_output_dir", None)
+    if sections_dir is not None:
+        durations = {}
+        for section in file_writer.sections:
+            if section.video is None or not section.partial_movie_files:
+                continue
+            video_path = os.path.join(sections_dir, section.video)
+            concat_with_holds(section.partial_movie_files, recorder.holds, video_path)
+            durations[section.video] = _video_duration(video_path)
+
+        # 小节清单中的时长按重新拼接后的视频更新
+        index_path = os.path.join(sections_dir, f"{file_writer.output_name}.json")
+        if durations and os.path.exists(index_path):
+            with open(index_path, encoding="utf-8") as f:
+                index = json.load(f)
+            for entry in index:
+                if entry.get("video") in durations:
+                    entry["duration"] = durations[entry["video"]]
+            with open(index_path, "w", encoding="utf-8") as f:
+                json.dump(index, f, ensure_ascii=False, indent=4)
+
+    frame_rate = scene.renderer.camera.frame_rate
+    return sum(round(duration * frame_rate) - 1 for duration in recorder.holds.values())
@@ -1,55 +1,373 @@
+import argparse
 import cv2
+import json
 import os
+import re
+import queue
+import threading
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
 from datetime import timedelta
 
-def extract_frames(video_path, output_folder):
+# 场景变化检测时缩小到的宽度（像素），只用于比较，不影响输出
+DIFF_WIDTH = 64
+
+# 每个解码进程的写图线程数，以及等待写出的帧数上限（4K 帧约 25MB）
+WRITER_THREADS = 4
+QUEUE_SIZE = 16
+
+# 每个解码进程中等待写出的帧最多占用的内存（MB），高分辨率视频会相应缩短队列
+QUEUE_MEMORY_MB = 256
+
+# 默认并行解码进程数上限：每个进程都有自己的帧队列，核心很多时不按核心数全开
+MAX_DEFAULT_JOBS = 8
+
+# 抽帧间隔达到该帧数时直接跳转到下一个采样帧，而不是逐帧 grab
+SEEK_MIN_GAP = 120
+
+# 每处理多少帧打印一次进度
+REPORT_EVERY = 100
+
+# 输出文件夹中记录提取参数和进度的清单，用于中断后继续和检查完整性
+MANIFEST_NAME = "extract_manifest.json"
+FRAME_NAME_PATTERN = re.compile(r"^frame_(\d+)_.*\.jpg$")
+
+def frame_file_name(frame_count, fps):
+    """文件名格式：frame_001_00-00-00.jpg（帧序号 + 时间点）"""
+    time_point = frame_count / fps
+    time_str = str(timedelta(seconds=time_point)).replace(":", "-")
+    return f"frame_{frame_count:03d}_{time_str}.jpg"
+
+def downscale(frame, width=DIFF_WIDTH):
+    """缩小为灰度小图，用于快速比较画面差异"""
+    height = max(1, round(frame.shape[0] * width / frame.shape[1]))
+    small = cv2.resize(frame, (width, height), interpolation=cv2.INTER_AREA)
+    return cv2.cvtColor(small, cv2.COLOR_BGR2GRAY).astype(np.int16)
+
+def queue_size_for(width, height):
+    """按单帧大小（BGR 每像素 3 字节）确定队列长度，内存不超过 QUEUE_MEMORY_MB"""
+    frame_bytes = max(1, int(width) * int(height) * 3)
+    return max(2, min(QUEUE_SIZE, QUEUE_MEMORY_MB * 2**20 // frame_bytes))
+
+def in_range(index, start, end):
+    """end 为 None 表示一直到视频结尾"""
+    return start <= index and (end is None or index < end)
+
+def frame_difference(small, last_small):
+    """两张小图的平均像素差（0~1）"""
+    return float(np.abs(small - last_small).mean()) / 255
+
+class JpegWriterPool:
+    """有界队列 + 多个写图线程
+
+    解码线程只负责把帧放入队列，JPEG 编码和写盘由写图线程完成
+    （cv2.imwrite 执行时会释放 GIL，多个线程可以真正并行）。
+    队列满时 submit 会阻塞，解码随之暂停，内存占用不超过 queue_size 帧。
+    """
+    def __init__(self, writers=WRITER_THREADS, queue_size=QUEUE_SIZE):
+        self.tasks = queue.Queue(maxsize=queue_size)
+        self.failed = []
+        self.error = None
+        self.threads = [threading.Thread(target=self._run, daemon=True) for _ in range(writers)]
+        for thread in self.threads:
+            thread.start()
+
+    def _run(self):
+        while True:
+            task = self.tasks.get()
+            if task is None:
+                return
+            output_path, frame = task
+            try:
+                # 先写临时文件再替换：中断时不会留下只写了一半的图片
+                success, data = cv2.imencode(".jpg", frame)
+                if not success:
+                    raise OSError("JPEG 编码失败")
+                tmp_path = output_path + ".tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(data.tobytes())
+                os.replace(tmp_path, output_path)
+            except OSError:
+                self.failed.append(output_path)
+            except Exception as e:
+                # 其他异常（如 cv2.error）不能让线程退出，否则队列无人消费，submit/close 会永远阻塞；
+                # 记录下来继续取帧，由 close() 重新抛出
+                self.failed.append(output_path)
+                if self.error is None:
+                    self.error = e
+
+    def submit(self, output_path, frame):
+        self.tasks.put((output_path, frame))
+
+    def close(self):
+        """等待队列中的帧全部写完；写图线程中出现过非 OSError 的异常时重新抛出"""
+        for _ in self.threads:
+            self.tasks.put(None)
+        for thread in self.threads:
+            thread.join()
+        if self.error is not None:
+            raise self.error
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+def extract_range(video_path, output_folder, start_frame, end_frame, scene_threshold=None, label="",
+                  writers=WRITER_THREADS, every_n=1, queue_size=QUEUE_SIZE):
+    """解码并保存 [start_frame, end_frame) 范围内的帧，返回 (处理帧数, 已保存的帧序号列表)
+
+    end_frame 为 None 时一直读到 read() 失败（视频结尾）为止。
+
+    可以在子进程中单独运行：先定位到 start_frame 再开始解码。
+    当前线程只负责解码，JPEG 编码交给 JpegWriterPool 的写图线程。
+    every_n > 1 时只保存全局帧序号为 every_n 倍数的帧：其余帧只 grab() 不 retrieve()，
+    间隔很大时直接跳转，耗时与保存的帧数成正比，而不是与视频长度成正比。
+    """
+    video = cv2.VideoCapture(video_path)
+    fps = video.get(cv2.CAP_PROP_FPS)
+    if start_frame > 0:
+        video.set(cv2.CAP_PROP_POS_FRAMES, start_frame)
+    
+    frame_count = start_frame
+    saved = []
+    last_small = None
+    next_report = start_frame + REPORT_EVERY
+    
+    with JpegWriterPool(writers, queue_size) as writer:
+        while end_frame is None or frame_count < end_frame:
+            # 不需要的帧：跳转或只 grab（不解码成图像）
+            if frame_count % every_n:
+                next_sample = (frame_count // every_n + 1) * every_n
+                if end_frame is not None:
+                    next_sample = min(end_frame, next_sample)
+                if next_sample - frame_count >= SEEK_MIN_GAP:
+                    video.set(cv2.CAP_PROP_POS_FRAMES, next_sample)
+                    frame_count = next_sample
+                    continue
+                if not video.grab():
+                    break
+                frame_count += 1
+                continue
+            
+            # 读取一帧
+            success, frame = video.read()
+            
+            if not success:
+                break
+            
+            save = True
+            if scene_threshold is not None:
+                small = downscale(frame)
+                save = last_small is None or frame_difference(small, last_small) > scene_threshold
+                if save:
+                    last_small = small
+            
+            if save:
+                output_path = os.path.join(output_folder, frame_file_name(frame_count, fps))
+                writer.submit(output_path, frame)
+                saved.append(frame_count)
+            
+            frame_count += 1
+            
+            # 打印进度
+            if frame_count >= next_report:
+                next_report += REPORT_EVERY
+                total = "" if end_frame is None else f"/{end_frame - start_frame}"
+                print(f"{label}已处理 {frame_count - start_frame}{total} 帧，已保存 {len(saved)} 帧")
+    
+    video.release()
+    if writer.failed:
+        print(f"{label}警告：{len(writer.failed)} 张图片写入失败，例如 {writer.failed[0]}")
+        failed = {os.path.basename(path) for path in writer.failed}
+        saved = [index for index in saved if frame_file_name(index, fps) not in failed]
+    return frame_count - start_frame, saved
+
+def split_ranges(total_frames, jobs):
+    """把 [0, total_frames) 平均分成 jobs 段
+
+    最后一段的终点为 None，读到视频结尾为止：CAP_PROP_FRAME_COUNT 只是容器中的估计值，
+    可变帧率或剪辑过的视频（如 render_all.py --compact-waits 的输出）常常偏少。
+    """
+    starts = sorted({total_frames * i // jobs for i in range(jobs)})
+    return list(zip(starts, starts[1:] + [None]))
+
+def existing_frames(output_folder):
+    """输出文件夹中已有图片的帧序号（只列一次目录，不读取文件）"""
+    indices = []
+    for name in os.listdir(output_folder):
+        match = FRAME_NAME_PATTERN.match(name)
+        if match:
+            indices.append(int(match.group(1)))
+        elif name.endswith(".jpg.tmp"):
+            # 上次中断时没写完的临时文件
+            os.remove(os.path.join(output_folder, name))
+    return sorted(indices)
+
+def resume_point(saved_indices, start_frame, end_frame, window):
+    """一段中可以安全继续的位置
+
+    写图线程按提交顺序取帧，任意时刻未写完的帧最多 window 个（队列长度 + 线程数），
+    所以倒数第 window + 1 张已有图片之前的帧一定都已完成。从这张图片所在的帧重新开始，
+    关键帧模式下它会重新成为比较基准，结果与不中断时一致。
+    """
+    saved = [index for index in saved_indices if in_range(index, start_frame, end_frame)]
+    if len(saved) <= window:
+        return start_frame
+    return saved[-(window + 1)]
+
+def video_fingerprint(video_path):
+    stat = os.stat(video_path)
+    return [os.path.abspath(video_path), stat.st_size, stat.st_mtime_ns]
+
+def load_manifest(manifest_path):
+    try:
+        with open(manifest_path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_manifest(manifest_path, manifest):
+    tmp_path = manifest_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False)
+    os.replace(tmp_path, manifest_path)
+
+def extract_frames(video_path, output_folder, scene_threshold=None, jobs=1, writers=WRITER_THREADS,
+                   every_n=1, sample_fps=None):
+    """把视频逐帧保存为 JPEG
+
+    scene_threshold 不为 None 时只保存关键帧：与上一张已保存的帧相比，
+    缩小后的平均像素差超过该阈值（0~1）才保存。self.wait 停顿期间的
+    重复画面不会再被写出，适合截取幻灯片图片。
+
+    jobs > 1 时把视频按时间分成 jobs 段，在多个进程中同时解码，
+    文件名仍按全局帧序号命名。关键帧模式下每一段的第一帧总会被保存。
+
+    every_n 为抽帧间隔（每 every_n 帧保存一帧）；指定 sample_fps 时按视频帧率换算间隔。
+
+    输出文件夹中的 extract_manifest.json 记录视频、参数、分段和已保存的帧。
+    中断后用相同参数重新运行会从每一段第一处可能缺失的帧继续；
+    已完整提取且图片都在时直接返回。
+    """
     # 创建输出文件夹
     if not os.path.exists(output_folder):
         os.makedirs(output_folder)
     
-    # 读取视频
+    # 读取视频的基本信息
     video = cv2.VideoCapture(video_path)
-    
-    # 获取视频的基本信息
     fps = video.get(cv2.CAP_PROP_FPS)
     total_frames = int(video.get(cv2.CAP_PROP_FRAME_COUNT))
+    queue_size = queue_size_for(video.get(cv2.CAP_PROP_FRAME_WIDTH), video.get(cv2.CAP_PROP_FRAME_HEIGHT))
+    video.release()
     duration = total_frames / fps
     
     print(f"视频FPS: {fps}")
-    print(f"总帧数: {total_frames}")
+    print(f"总帧数（估计）: {total_frames}")
     print(f"视频时长: {timedelta(seconds=duration)}")
     
-    frame_count = 0
+    if sample_fps:
+        every_n = max(1, round(fps / sample_fps))
+    every_n = max(1, every_n)
+    if every_n > 1:
+        print(f"每 {every_n} 帧保存一帧")
     
-    while True:
-        # 读取一帧
-        success, frame = video.read()
-        
-        if not success:
-            break
-            
-        # 计算当前时间点
-        time_point = frame_count / fps
-        time_str = str(timedelta(seconds=time_point)).replace(":", "-")
-        
-        # 保存图片，文件名格式：frame_001_00-00-00.jpg
-        output_path = os.path.join(
-            output_folder, 
-            f"frame_{frame_count:03d}_{time_str}.jpg"
+    manifest_path = os.path.join(output_folder, MANIFEST_NAME)
+    options = {"video": video_fingerprint(video_path), "scene_threshold": scene_threshold, "every_n": every_n}
+    manifest = load_manifest(manifest_path)
+    window = queue_size + writers
+    saved_indices = existing_frames(output_folder)
+    
+    if manifest.get("options") == options:
+        if manifest.get("complete"):
+            present = set(saved_indices)
+            missing = [index for index in manifest["frames"] if index not in present]
+            if not missing:
+                print(f"已完整提取（{len(manifest['frames'])} 帧），无需重新运行。")
+                return
+            print(f"清单中有 {len(missing)} 帧缺失，重新提取")
+        # 沿用上次的分段，保证关键帧模式下的结果与不中断时一致
+        ranges = [tuple(r) for r in manifest["ranges"]]
+        window = max(window, manifest["window"])
+        starts = [resume_point(saved_indices, start, end, window) for start, end in ranges]
+        if manifest.get("complete"):
+            # 已完成过的提取只需补上缺失的帧：每一段从第一张缺失的图片开始，没有缺失的段（None）直接跳过
+            starts = [
+                min([index for index in missing if in_range(index, start, end)], default=None)
+                for start, end in ranges
+            ]
+        done = 0
+        for resume, (start, end) in zip(starts, ranges):
+            stop = end if resume is None else resume
+            done += (total_frames if stop is None else stop) - start
+        print(f"继续上次未完成的提取（已完成约 {done}/{total_frames} 帧）")
+    else:
+        if saved_indices:
+            print(f"警告：输出文件夹中已有 {len(saved_indices)} 张其他参数生成的图片，同名文件将被覆盖")
+        ranges = split_ranges(total_frames, max(1, jobs))
+        starts = [start for start, end in ranges]
+    
+    save_manifest(manifest_path, {"options": options, "ranges": ranges, "window": window, "complete": False})
+    
+    # 每一段中继续位置之前已经保存的帧（跳过的段保留全部）
+    frames = [index for index in saved_indices
+              if any(in_range(index, start, end if resume is None else resume)
+                     for resume, (start, end) in zip(starts, ranges))]
+    work = [(i, resume, end) for i, (resume, (start, end)) in enumerate(zip(starts, ranges)) if resume is not None]
+    frame_count = 0
+    if len(work) == 1:
+        _, resume, end = work[0]
+        processed, saved = extract_range(
+            video_path, output_folder, resume, end, scene_threshold, writers=writers, every_n=every_n,
+            queue_size=queue_size
         )
-        cv2.imwrite(output_path, frame)
-        
-        frame_count += 1
-        
-        # 打印进度
-        if frame_count % 100 == 0:
-            print(f"已处理 {frame_count}/{total_frames} 帧")
+        frame_count += processed
+        frames.extend(saved)
+    elif work:
+        print(f"分为 {len(work)} 段并行解码")
+        with ProcessPoolExecutor(max_workers=len(work)) as executor:
+            futures = [
+                executor.submit(extract_range, video_path, output_folder, resume, end, scene_threshold,
+                                f"[第{i + 1}段] ", writers, every_n, queue_size)
+                for i, resume, end in work
+            ]
+            for future in futures:
+                processed, saved = future.result()
+                frame_count += processed
+                frames.extend(saved)
     
-    video.release()
-    print("完成！所有帧已保存。")
+    frames.sort()
+    save_manifest(manifest_path, {
+        "options": options, "ranges": ranges, "window": window, "complete": True, "frames": frames
+    })
+    print(f"完成！本次处理 {frame_count} 帧，共保存 {len(frames)} 帧。")
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="把视频逐帧保存为图片")
+    parser.add_argument("video_path", nargs="?",
+                        default=r"E:\Projects\manimProj\BinarySplit\media\videos\1440p60\BinarySearchAnimation.mp4",
+                        help="视频文件路径")
+    parser.add_argument("output_folder", nargs="?",
+                        default=r"E:\Projects\manimProj\BinarySplit\media\images",
+                        help="保存图片的文件夹")
+    parser.add_argument("--scene-threshold", type=float, default=None,
+                        help="只保存画面变化超过该阈值的关键帧（0~1，例如 0.01）")
+    parser.add_argument("-j", "--jobs", type=int, default=min(os.cpu_count() or 1, MAX_DEFAULT_JOBS),
+                        help=f"并行解码的进程数（默认等于CPU核心数，最多 {MAX_DEFAULT_JOBS}）")
+    parser.add_argument("--writers", type=int, default=WRITER_THREADS,
+                        help=f"每个解码进程的 JPEG 写图线程数（默认 {WRITER_THREADS}）")
+    sampling = parser.add_mutually_exclusive_group()
+    sampling.add_argument("--fps", type=float, default=None,
+                          help="按目标帧率抽帧，例如 --fps 1 每秒保存一帧")
+    sampling.add_argument("--every-n", type=int, default=1,
+                          help="每 N 帧保存一帧（默认 1，即每一帧）")
+    return parser.parse_args(argv)
 
-# 使用示例
-video_path = r"E:\Projects\manimProj\BinarySplit\media\videos\1440p60\BinarySearchAnimation.mp4"  # 替换为你的视频文件路径
-output_folder = r"E:\Projects\manimProj\BinarySplit\media\images"  # 替换为你想保存图片的文件夹路径
+def main(argv=None):
+    args = parse_args(argv)
+    extract_frames(args.video_path, args.output_folder, args.scene_threshold, args.jobs, args.writers,
+                   args.every_n, args.fps)
 
-extract_frames(video_path, output_folder)
\ No newline at end of file
+if __name__ == "__main__":
+    main()
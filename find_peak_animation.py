@@ -1,4 +1,5 @@
 from manim import *
+from search_trace import peak_trace
 
 class PeakFindingScene(Scene):
     def construct(self):
@@ -21,6 +22,7 @@ class PeakFindingScene(Scene):
         ]
 
         for case_idx, (arr, peak, description) in enumerate(cases):
+            self.next_section(f"Corner Case {case_idx + 1}")
             # 创建数组可视化
             dots, lines, numbers, indices = self.create_array_visualization(arr)
             
@@ -54,8 +56,13 @@ class PeakFindingScene(Scene):
             else:  # L=n-3, R=n-1
                 left, right = len(arr)-3, len(arr)-1
 
+            # 峰值查找轨迹（这里只展示第一次迭代）
+            trace = list(peak_trace(arr, left, right))
+            mid = next(event.mid for event in trace if event.kind == "mid")
+            compare = next(event for event in trace if event.kind == "compare")
+
             # 显示初始指针位置
-            pointers = self.show_pointers(dots, left, (left + right) // 2, right)
+            pointers = self.show_pointers(dots, left, mid, right)
             
             # 显示关键信息
             key_info = VGroup(
@@ -69,10 +76,9 @@ class PeakFindingScene(Scene):
             self.wait(1)
 
             # 展示一次迭代后的结果
-            mid = (left + right) // 2
             next_info = VGroup(
                 Text(f"mid = ({left} + {right}) // 2 = {mid}", font_size=24),
-                Text(f"Compare: arr[{mid}]={arr[mid]}", font_size=24)
+                Text(f"Compare: arr[{mid}]={compare.value}", font_size=24)
             ).arrange(DOWN, aligned_edge=LEFT)
             next_info.next_to(key_info, DOWN, buff=0.5)
             
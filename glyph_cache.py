@@ -0,0 +1,109 @@
+"""
+文字字形缓存
+
+数组中的数值、索引标签几乎都是重复的短文本（"0"、"1"、"53"……），
+每次 Text(...) 都要经过 Pango 光栅化和 SVG 解析。这里按
+(文本, 字体, 字号, 颜色) 缓存矢量化后的字形路径：
+    1. 进程内缓存：同一次渲染中直接返回副本；
+    2. 磁盘缓存：保存为 .npz，在不同场景、不同次运行、并行渲染进程之间共享。
+
+无论缓存是否命中，返回的都是 VGroup（每个字符一个 VMobject），不是 Text。
+缓存键包含字体文件指纹（见 render_cache.font_fingerprint），安装或更换字体后会重新生成。
+
+缓存目录默认为 <media_dir>/glyph_cache（跟随 render_all.py --media-dir），
+可通过环境变量 GLYPH_CACHE_DIR 修改。
+"""
+from manim import *
+import hashlib
+import os
+import tempfile
+import zipfile
+import numpy as np
+
+from render_cache import font_fingerprint
+
+# 缓存格式版本，修改存储格式时递增
+CACHE_VERSION = 2
+
+_MEMORY_CACHE = {}
+_FONT_FINGERPRINTS = {}
+
+
+def cache_dir():
+    return os.environ.get("GLYPH_CACHE_DIR") or os.path.join(config.media_dir, "glyph_cache")
+
+
+def _cache_path(key):
+    import manim
+    font = key[1]
+    if font not in _FONT_FINGERPRINTS:
+        _FONT_FINGERPRINTS[font] = font_fingerprint(font)
+    raw = repr((CACHE_VERSION, manim.__version__, _FONT_FINGERPRINTS[font]) + key).encode("utf-8")
+    return os.path.join(cache_dir(), hashlib.sha1(raw).hexdigest() + ".npz")
+
+
+def _glyph_arrays(text_mob):
+    """取出 Text 各字符的路径点和颜色"""
+    parts = [mob for mob in text_mob.family_members_with_points()]
+    points = [mob.points for mob in parts]
+    return {
+        "points": np.concatenate(points) if points else np.zeros((0, 3)),
+        "lengths": np.array([len(p) for p in points], dtype=np.int64),
+        "fill": np.array([mob.get_fill_rgbas()[0] for mob in parts]).reshape(-1, 4),
+        "stroke": np.array([mob.get_stroke_rgbas()[0] for mob in parts]).reshape(-1, 4),
+        "stroke_width": np.array([mob.get_stroke_width() for mob in parts], dtype=float),
+    }
+
+
+def _build(arrays):
+    """由路径点和颜色重建字形（VGroup，每个字符一个 VMobject）"""
+    points = arrays["points"]
+    lengths = arrays["lengths"]
+    fill = arrays["fill"]
+    stroke = arrays["stroke"]
+    stroke_width = arrays["stroke_width"]
+
+    glyph = VGroup()
+    offsets = np.concatenate([[0], np.cumsum(lengths)])
+    for i in range(len(lengths)):
+        part = VMobject()
+        part.set_points(points[offsets[i]:offsets[i + 1]])
+        part.set_fill(rgb_to_hex(fill[i][:3]), opacity=fill[i][3])
+        part.set_stroke(rgb_to_hex(stroke[i][:3]), width=stroke_width[i], opacity=stroke[i][3])
+        glyph.add(part)
+    return glyph
+
+
+def _save(arrays, path):
+    """写入 .npz（先写临时文件再替换，避免并行进程读到半个文件）"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.savez(f, **arrays)
+        os.replace(tmp_path, path)
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def _load(path):
+    with np.load(path) as data:
+        return _build({name: data[name] for name in data.files})
+
+
+def cached_text(text, font="SimSun", font_size=24, color="#000000"):
+    """返回缓存字形的副本，首次使用时才真正调用 Text 光栅化"""
+    key = (text, font, font_size, str(color))
+    glyph = _MEMORY_CACHE.get(key)
+    if glyph is None:
+        path = _cache_path(key)
+        try:
+            glyph = _load(path)
+        except (OSError, KeyError, ValueError, EOFError, zipfile.BadZipFile):
+            # 缓存不存在或文件损坏（如写入中断）时重新生成
+            arrays = _glyph_arrays(Text(text, font=font, font_size=font_size, color=color))
+            _save(arrays, path)
+            glyph = _build(arrays)
+        _MEMORY_CACHE[key] = glyph
+    return glyph.copy()
@@ -1,4 +1,7 @@
 from manim import *
+from array_strip import ArrayStrip
+from search_trace import linear_search_trace
+from style_animations import BatchedStyle, StyleTarget, SetStroke
 
 class LinearSearchAnimation(Scene):
 
@@ -45,8 +48,8 @@ class LinearSearchAnimation(Scene):
             color=self.TEXT_COLOR
         )
 
-    def __init__(self):
-        super().__init__()
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
         # 设置背景颜色为浅灰色背景
         self.camera.background_color = "#FFFFFF"
         
@@ -58,7 +61,16 @@ class LinearSearchAnimation(Scene):
         self.NOT_FOUND_COLOR = "#E74C3C"  # 未找到时的颜色（红色）
         self.SCANNED_COLOR = "#9B59B6"    # 已扫描标记颜色（紫色）
 
-                
+        # 使用与二分查找相同的数组
+        self.numbers = [2, 5, 8, 13, 17, 22, 26, 31, 35, 39, 44, 48, 53, 57, 62, 66, 71, 75, 80, 85]
+        self.target = 53
+
+        # 设置方块属性
+        self.square_size = 0.7
+        self.stroke_width = 2
+
+    def setup(self):
+        """创建场景中的所有对象（渲染开始时由 manim 调用，构造场景对象时不会执行）"""
         watermark = Text(
             "作者：温程远", 
             font="SimSun",
@@ -70,55 +82,29 @@ class LinearSearchAnimation(Scene):
         # 将水印添加到场景
         self.add(watermark)
 
-        # 使用与二分查找相同的数组
-        self.numbers = [2, 5, 8, 13, 17, 22, 26, 31, 35, 39, 44, 48, 53, 57, 62, 66, 71, 75, 80, 85]
-        self.target = 53
-
         # 创建标题
         self.title = Text("线性查找演示", font="SimSun", color=self.TEXT_COLOR).to_edge(UP, buff=0.3)
-        self.play(Write(self.title))
         
-        # 创建数组可视化
-        self.squares = VGroup()
-        self.numbers_text = VGroup()
-        self.index_text = VGroup()
-        
-        # 设置方块属性
-        self.square_size = 0.7
-        self.stroke_width = 2
-        
-        # 创建方块、数字和索引
-        for i, num in enumerate(self.numbers):
-            square = Square(
-                side_length=self.square_size,
-                stroke_width=self.stroke_width,
-                stroke_color=self.SQUARE_COLOR
-            ).shift(RIGHT * i * (self.square_size + self.stroke_width/100))
-            self.squares.add(square)
-            
-            # 如果数字等于目标值，使用红色显示
-            number_color = self.NOT_FOUND_COLOR if num == self.target else self.TEXT_COLOR
-            number = Text(
-                str(num), 
-                font="SimSun", 
-                font_size=24, 
-                color=number_color
-            ).move_to(square.get_center())
-            self.numbers_text.add(number)
-            
-            index = Text(str(i), font="SimSun", font_size=20, color=self.TEXT_COLOR).next_to(square, DOWN, buff=0.2)
-            self.index_text.add(index)
+        # 创建数组可视化（方块、数字和索引），目标值显示为红色
+        self.array_group = ArrayStrip(
+            self.numbers,
+            square_size=self.square_size,
+            cell_buff=self.stroke_width/100,
+            stroke_width=self.stroke_width,
+            stroke_color=self.SQUARE_COLOR,
+            font="SimSun",
+            font_size=24,
+            text_color=self.TEXT_COLOR,
+            value_colors=[self.NOT_FOUND_COLOR if num == self.target else self.TEXT_COLOR for num in self.numbers],
+            index_color=self.TEXT_COLOR
+        )
+        self.squares = self.array_group.squares
+        self.numbers_text = self.array_group.numbers_text
+        self.index_text = self.array_group.index_text
         
-        self.array_group = VGroup(self.squares, self.numbers_text, self.index_text)
         self.array_group.move_to(ORIGIN + UP * 0.5)
         self.array_group.scale_to_fit_width(config.frame_width - 1)
         
-        self.play(
-            Create(self.squares),
-            Write(self.numbers_text),
-            Write(self.index_text)
-        )
-        
 
         
         # 添加用于存储已检查和已跳过元素的标记
@@ -151,20 +137,31 @@ class LinearSearchAnimation(Scene):
         ).arrange(RIGHT, buff=0.1)
         
         self.target_text = target_text_group.next_to(self.title, DOWN, buff=0.3)
-        self.play(Write(self.target_text))
 
 
     def mark_scanned(self, index):
         """标记已扫描的元素"""
-        return AnimationGroup(
-            self.squares[index].animate.set_stroke(opacity=0.6),
-            self.numbers_text[index].animate.set_opacity(0.6),
-            self.index_text[index].animate.set_opacity(0.6),
-            self.scanned_marks[index].animate.set_opacity(1),
+        return BatchedStyle(
+            StyleTarget(self.squares[index], stroke_opacity=0.6),
+            StyleTarget(self.numbers_text[index], fill_opacity=0.6, stroke_opacity=0.6),
+            StyleTarget(self.index_text[index], fill_opacity=0.6, stroke_opacity=0.6),
+            StyleTarget(self.scanned_marks[index], fill_opacity=1, stroke_opacity=1),
             lag_ratio=0.1
         )
 
     def construct(self):
+        # 开场：标题、数组和目标值
+        self.next_section("开场")
+        self.play(Write(self.title))
+        
+        self.play(
+            Create(self.squares),
+            Write(self.numbers_text),
+            Write(self.index_text)
+        )
+        
+        self.play(Write(self.target_text))
+
         # 创建当前索引指示器
         pointer = Arrow(
             start=DOWN * 0.4,
@@ -182,30 +179,31 @@ class LinearSearchAnimation(Scene):
             Write(pointer_label)
         )
 
-        found = False
-        
-        for i in range(len(self.numbers)):
-            # 更新指针位置
-            self.play(
-                pointer.animate.next_to(self.squares[i], DOWN, buff=0.7),
-                pointer_label.animate.next_to(self.squares[i], DOWN, buff=1.2)
-            )
-            
-            # 高亮当前检查的元素
-            self.play(self.squares[i].animate.set_stroke(color=self.CURRENT_COLOR))
-            
-            # 创建比较过程的文本
-            
-            comparison_text = self.create_comparison_text(
-                f"list[{i}]", 
-                str(self.target),
-                "==" if self.numbers[i] == self.target else ("<" if self.numbers[i] < self.target else ">")
-            ).next_to(self.target_text, DOWN, buff=2).shift(DOWN*1.5)
-
-            self.play(Write(comparison_text))
+        # 按照算法轨迹逐步播放动画
+        for event in linear_search_trace(self.numbers, self.target):
+            i = event.index
+            if event.kind == "visit":
+                self.next_section(f"检查索引{i}")
+                # 更新指针位置
+                self.play(
+                    pointer.animate.next_to(self.squares[i], DOWN, buff=0.7),
+                    pointer_label.animate.next_to(self.squares[i], DOWN, buff=1.2)
+                )
+                
+                # 高亮当前检查的元素
+                self.play(SetStroke(self.squares[i], color=self.CURRENT_COLOR))
+
+            elif event.kind == "compare":
+                # 创建比较过程的文本
+                comparison_text = self.create_comparison_text(
+                    f"list[{i}]", 
+                    str(self.target),
+                    event.op
+                ).next_to(self.target_text, DOWN, buff=2).shift(DOWN*1.5)
+
+                self.play(Write(comparison_text))
             
-            if self.numbers[i] == self.target:
-                found = True
+            elif event.kind == "found":
                 # 找到目标值
                 reasoning = self.create_reasoning_text(
                     f"找到目标值！位于索引 {i}"
@@ -213,10 +211,10 @@ class LinearSearchAnimation(Scene):
                 
                 self.play(
                     Write(reasoning),
-                    self.squares[i].animate.set_stroke(color=self.HIGHLIGHT_COLOR)
+                    SetStroke(self.squares[i], color=self.HIGHLIGHT_COLOR)
                 )
-                break
-            else:
+
+            elif event.kind == "miss":
                 # 未找到，继续搜索
                 reasoning = self.create_reasoning_text(
                     f"不是目标值，继续向后搜索"
@@ -226,26 +224,25 @@ class LinearSearchAnimation(Scene):
                 
                 self.play(self.mark_scanned(i))
 
-
-
                 # 恢复方块颜色并移除文本
                 self.play(
-                    self.squares[i].animate.set_stroke(color=self.SQUARE_COLOR),
+                    SetStroke(self.squares[i], color=self.SQUARE_COLOR),
                     FadeOut(comparison_text),
                     FadeOut(reasoning)
                 )
 
-        if not found:
-            # 目标值不在数组中
-            not_found_text = Text(
-                f"目标值 {self.target} 不存在于数组中！",
-                font="SimSun",
-                color=self.NOT_FOUND_COLOR,
-                font_size=36
-            ).next_to(self.target_text, DOWN, buff=1.5)
-            
-            self.play(Write(not_found_text))
+            elif event.kind == "not_found":
+                # 目标值不在数组中
+                not_found_text = Text(
+                    f"目标值 {self.target} 不存在于数组中！",
+                    font="SimSun",
+                    color=self.NOT_FOUND_COLOR,
+                    font_size=36
+                ).next_to(self.target_text, DOWN, buff=1.5)
+                
+                self.play(Write(not_found_text))
 
+        self.next_section("结束")
         self.wait(2)
 
 if __name__ == "__main__":
@@ -1,8 +1,11 @@
 from manim import *
+from array_strip import ArrayStrip
+from glyph_cache import cached_text
+from style_animations import SetColor, SetStroke, ScaleBy
 
 class ListBasicsAnimation(Scene):
-    def __init__(self):
-        super().__init__()
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
         # 设置背景颜色为白色
         self.camera.background_color = "#FFFFFF"
 
@@ -14,6 +17,7 @@ class ListBasicsAnimation(Scene):
         self.CODE_COLOR = "#E67E22"       # 温暖的橙色
         self.ELEMENT_COLOR = "#9B59B6"    # 优雅的紫色
 
+    def setup(self):
         # 创建水印
         watermark = Text(
             "作者：温程远",
@@ -26,6 +30,7 @@ class ListBasicsAnimation(Scene):
 
     def construct(self):
         # ====== 第一部分：什么是列表 ======
+        self.next_section("第一部分：什么是列表")
         title = Text("Python 列表基础", font="SimSun", color=self.TEXT_COLOR, font_size=48)
         title.to_edge(UP, buff=0.3)
         self.play(Write(title))
@@ -61,6 +66,7 @@ class ListBasicsAnimation(Scene):
         )
 
         # ====== 第二部分：创建列表 ======
+        self.next_section("第二部分：创建列表")
         subtitle1 = Text("1. 创建列表", font="SimSun", color=self.CODE_COLOR, font_size=36)
         subtitle1.next_to(title, DOWN, buff=0.6)
         self.play(Write(subtitle1))
@@ -78,29 +84,19 @@ class ListBasicsAnimation(Scene):
 
         # 可视化列表
         numbers = [2, 5, 8, 13, 17, 22, 26, 31]
-        squares = VGroup()
-        numbers_text = VGroup()
-
-        square_size = 0.8
         stroke_width = 2
-
-        for i, num in enumerate(numbers):
-            square = Square(
-                side_length=square_size,
-                stroke_width=stroke_width,
-                stroke_color=self.SQUARE_COLOR
-            ).shift(RIGHT * i * (square_size + stroke_width/100))
-            squares.add(square)
-
-            number = Text(
-                str(num),
-                font="SimSun",
-                font_size=28,
-                color=self.TEXT_COLOR
-            ).move_to(square.get_center())
-            numbers_text.add(number)
-
-        array_group = VGroup(squares, numbers_text)
+        array_group = ArrayStrip(
+            numbers,
+            square_size=0.8,
+            cell_buff=stroke_width/100,
+            stroke_width=stroke_width,
+            stroke_color=self.SQUARE_COLOR,
+            font="SimSun",
+            font_size=28,
+            text_color=self.TEXT_COLOR,
+            index_direction=None
+        )
+        squares, numbers_text = array_group.squares, array_group.numbers_text
         array_group.scale_to_fit_width(config.frame_width - 2)
         array_group.move_to(ORIGIN + DOWN * 0.8)  # 向下移动，避免与上方文本重叠
 
@@ -117,6 +113,7 @@ class ListBasicsAnimation(Scene):
         )
 
         # ====== 第三部分：索引访问 ======
+        self.next_section("第三部分：索引访问")
         subtitle2 = Text("2. 索引访问", font="SimSun", color=self.CODE_COLOR, font_size=36)
         subtitle2.next_to(title, DOWN, buff=0.6)
         self.play(Write(subtitle2))
@@ -124,7 +121,7 @@ class ListBasicsAnimation(Scene):
         # 添加索引标记
         index_text = VGroup()
         for i in range(len(numbers)):
-            index = Text(
+            index = cached_text(
                 str(i),
                 font="SimSun",
                 font_size=24,
@@ -165,18 +162,18 @@ class ListBasicsAnimation(Scene):
             # 高亮对应的方块
             self.play(
                 Write(access_code),
-                squares[idx].animate.set_stroke(color=self.HIGHLIGHT_COLOR, width=4),
-                numbers_text[idx].animate.set_color(self.HIGHLIGHT_COLOR),
-                index_text[idx].animate.scale(1.3)
+                SetStroke(squares[idx], color=self.HIGHLIGHT_COLOR, width=4),
+                SetColor(numbers_text[idx], self.HIGHLIGHT_COLOR),
+                ScaleBy(index_text[idx], 1.3)
             )
             self.wait(1)
 
             # 恢复
             self.play(
                 FadeOut(access_code),
-                squares[idx].animate.set_stroke(color=self.SQUARE_COLOR, width=stroke_width),
-                numbers_text[idx].animate.set_color(self.TEXT_COLOR),
-                index_text[idx].animate.scale(1/1.3)
+                SetStroke(squares[idx], color=self.SQUARE_COLOR, width=stroke_width),
+                SetColor(numbers_text[idx], self.TEXT_COLOR),
+                ScaleBy(index_text[idx], 1/1.3)
             )
 
         self.play(
@@ -185,6 +182,7 @@ class ListBasicsAnimation(Scene):
         )
 
         # ====== 第四部分：列表操作 ======
+        self.next_section("第四部分：列表操作")
         subtitle3 = Text("3. 列表操作", font="SimSun", color=self.CODE_COLOR, font_size=36)
         subtitle3.next_to(title, DOWN, buff=0.6)
         self.play(Write(subtitle3))
@@ -201,8 +199,8 @@ class ListBasicsAnimation(Scene):
 
         # 高亮要修改的元素
         self.play(
-            squares[2].animate.set_stroke(color=self.CODE_COLOR, width=4),
-            numbers_text[2].animate.set_color(self.CODE_COLOR).scale(1.2)
+            SetStroke(squares[2], color=self.CODE_COLOR, width=4),
+            SetColor(numbers_text[2], self.CODE_COLOR, scale=1.2)
         )
         self.wait(0.5)
 
@@ -210,13 +208,13 @@ class ListBasicsAnimation(Scene):
         new_number = Text("10", font="SimSun", font_size=28, color=self.HIGHLIGHT_COLOR).move_to(numbers_text[2])
         self.play(
             Transform(numbers_text[2], new_number),
-            squares[2].animate.set_stroke(color=self.HIGHLIGHT_COLOR, width=4)
+            SetStroke(squares[2], color=self.HIGHLIGHT_COLOR, width=4)
         )
         self.wait(1)
 
         # 恢复
         self.play(
-            squares[2].animate.set_stroke(color=self.SQUARE_COLOR, width=stroke_width),
+            SetStroke(squares[2], color=self.SQUARE_COLOR, width=stroke_width),
             FadeOut(operation1)
         )
 
@@ -232,20 +230,21 @@ class ListBasicsAnimation(Scene):
 
         # 依次高亮所有元素
         self.play(
-            *[squares[i].animate.set_stroke(color=self.INDEX_COLOR, width=3) for i in range(len(numbers))],
+            *[SetStroke(squares[i], color=self.INDEX_COLOR, width=3) for i in range(len(numbers))],
             run_time=1.5
         )
         self.wait(1)
 
         # 恢复
         self.play(
-            *[squares[i].animate.set_stroke(color=self.SQUARE_COLOR, width=stroke_width) for i in range(len(numbers))],
+            *[SetStroke(squares[i], color=self.SQUARE_COLOR, width=stroke_width) for i in range(len(numbers))],
             FadeOut(operation2)
         )
 
         self.play(FadeOut(subtitle3))
 
         # ====== 第五部分：引出查找需求 ======
+        self.next_section("第五部分：引出查找需求")
         subtitle4 = Text("4. 查找问题", font="SimSun", color=self.CODE_COLOR, font_size=36)
         subtitle4.next_to(title, DOWN, buff=0.6)
         self.play(Write(subtitle4))
@@ -273,8 +272,8 @@ class ListBasicsAnimation(Scene):
         # 高亮目标值
         target_idx = 5  # 22在索引5的位置
         self.play(
-            squares[target_idx].animate.set_stroke(color="#E74C3C", width=4),
-            numbers_text[target_idx].animate.set_color("#E74C3C").scale(1.3)
+            SetStroke(squares[target_idx], color="#E74C3C", width=4),
+            SetColor(numbers_text[target_idx], "#E74C3C", scale=1.3)
         )
         self.wait(1.5)
 
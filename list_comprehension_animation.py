@@ -1,9 +1,10 @@
 from manim import *
+from style_animations import SetColor
 
 class ListComprehensionAnimation(Scene):
     """列表推导式和数值列表动画"""
-    def __init__(self):
-        super().__init__()
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
         self.camera.background_color = "#FFFFFF"
 
         # 颜色方案
@@ -14,6 +15,7 @@ class ListComprehensionAnimation(Scene):
         self.CODE_COLOR = "#E67E22"
         self.COMPREHENSION_COLOR = "#9B59B6"
 
+    def setup(self):
         # 创建水印
         watermark = Text(
             "作者：温程远",
@@ -26,12 +28,14 @@ class ListComprehensionAnimation(Scene):
 
     def construct(self):
         # 标题
+        self.next_section("标题")
         title = Text("数值列表与列表推导式", font="SimSun", color=self.TEXT_COLOR, font_size=44)
         title.to_edge(UP, buff=0.3)
         self.play(Write(title))
         self.wait(0.5)
 
         # ====== 第一部分：range()生成数值列表 ======
+        self.next_section("第一部分：range()生成数值列表")
         subtitle1 = Text("1. 使用 range() 生成数值列表", font="SimSun", color=self.CODE_COLOR, font_size=32)
         subtitle1.next_to(title, DOWN, buff=0.4)
         self.play(Write(subtitle1))
@@ -79,6 +83,7 @@ class ListComprehensionAnimation(Scene):
         )
 
         # ====== 第二部分：列表推导式基础 ======
+        self.next_section("第二部分：列表推导式基础")
         subtitle2 = Text("2. 列表推导式 - 基础语法", font="SimSun", color=self.CODE_COLOR, font_size=32)
         subtitle2.next_to(title, DOWN, buff=0.4)
         self.play(Write(subtitle2))
@@ -153,6 +158,7 @@ class ListComprehensionAnimation(Scene):
         )
 
         # ====== 第三部分：带条件的列表推导式 ======
+        self.next_section("第三部分：带条件的列表推导式")
         subtitle3 = Text("3. 带条件的列表推导式", font="SimSun", color=self.CODE_COLOR, font_size=32)
         subtitle3.next_to(title, DOWN, buff=0.4)
         self.play(Write(subtitle3))
@@ -192,7 +198,7 @@ class ListComprehensionAnimation(Scene):
         for i in range(1, 11):
             if i % 2 == 0:
                 self.play(
-                    all_nums[i-1].animate.set_color(self.HIGHLIGHT_COLOR).scale(1.3),
+                    SetColor(all_nums[i-1], self.HIGHLIGHT_COLOR, scale=1.3),
                     run_time=0.3
                 )
 
@@ -214,6 +220,7 @@ class ListComprehensionAnimation(Scene):
         )
 
         # ====== 第四部分：嵌套列表推导式 ======
+        self.next_section("第四部分：嵌套列表推导式")
         subtitle4 = Text("4. 嵌套列表推导式", font="SimSun", color=self.CODE_COLOR, font_size=32)
         subtitle4.next_to(title, DOWN, buff=0.4)
         self.play(Write(subtitle4))
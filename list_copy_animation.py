@@ -3,8 +3,8 @@ import numpy as np
 
 class ListCopyAnimation(Scene):
     """列表深浅拷贝3D动画 - 引用、浅拷贝、深拷贝对比"""
-    def __init__(self):
-        super().__init__()
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
         self.camera.background_color = "#FFFFFF"
 
         # 颜色方案
@@ -19,6 +19,7 @@ class ListCopyAnimation(Scene):
         # 使用更好的中文字体
         self.CHINESE_FONT = "Microsoft YaHei"
 
+    def setup(self):
         # 创建水印
         watermark = Text(
             "作者：温程远",
@@ -143,6 +144,7 @@ class ListCopyAnimation(Scene):
 
     def construct(self):
         # 标题
+        self.next_section("标题")
         title = Text(
             "Python 列表复制：引用 vs 浅拷贝 vs 深拷贝",
             font=self.CHINESE_FONT,
@@ -154,6 +156,7 @@ class ListCopyAnimation(Scene):
         self.wait(0.5)
 
         # ====== 场景1：引用赋值（=） ======
+        self.next_section("场景1：引用赋值（=）")
         subtitle1 = Text(
             "方式1：引用赋值 (=)",
             font=self.CHINESE_FONT,
@@ -253,6 +256,7 @@ class ListCopyAnimation(Scene):
         )
 
         # ====== 场景2：浅拷贝（.copy()） ======
+        self.next_section("场景2：浅拷贝（.copy()）")
         subtitle2 = Text(
             "方式2：浅拷贝 (.copy())",
             font=self.CHINESE_FONT,
@@ -366,6 +370,7 @@ class ListCopyAnimation(Scene):
         )
 
         # ====== 场景3：深拷贝（deepcopy()） ======
+        self.next_section("场景3：深拷贝（deepcopy()）")
         subtitle3 = Text(
             "方式3：深拷贝 (copy.deepcopy())",
             font=self.CHINESE_FONT,
@@ -505,6 +510,7 @@ class ListCopyAnimation(Scene):
         )
 
         # ====== 总结对比 ======
+        self.next_section("总结对比")
         summary_title = Text(
             "三种方式对比总结",
             font=self.CHINESE_FONT,
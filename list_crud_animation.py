@@ -1,9 +1,12 @@
 from manim import *
+from array_strip import ArrayStrip
+from glyph_cache import cached_text
+from style_animations import SetColor, SetStroke
 
 class ListCRUDAnimation(Scene):
     """列表的增删查改操作动画 - 修复版"""
-    def __init__(self):
-        super().__init__()
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
         self.camera.background_color = "#FFFFFF"
 
         # 颜色方案
@@ -19,6 +22,7 @@ class ListCRUDAnimation(Scene):
         # 使用更好的中文字体
         self.CHINESE_FONT = "Microsoft YaHei"
 
+    def setup(self):
         # 创建水印
         watermark = Text(
             "作者：温程远",
@@ -31,62 +35,26 @@ class ListCRUDAnimation(Scene):
 
     def create_list_visualization(self, data, var_name="numbers", position=ORIGIN):
         """创建列表可视化，包含变量名"""
-        squares = VGroup()
-        numbers_text = VGroup()
-
-        square_size = 0.7
-        stroke_width = 2
-
-        for i, num in enumerate(data):
-            square = Square(
-                side_length=square_size,
-                stroke_width=stroke_width,
-                stroke_color=self.SQUARE_COLOR
-            ).shift(RIGHT * i * (square_size + 0.02))
-            squares.add(square)
-
-            number = Text(
-                str(num),
-                font=self.CHINESE_FONT,
-                font_size=26,
-                color=self.TEXT_COLOR
-            ).move_to(square.get_center())
-            numbers_text.add(number)
-
-        # 添加索引（在方框下方）
-        index_text = VGroup()
-        for i in range(len(data)):
-            index = Text(
-                str(i),
-                font=self.CHINESE_FONT,
-                font_size=20,
-                color=self.INDEX_COLOR
-            ).next_to(squares[i], DOWN, buff=0.2)
-            index_text.add(index)
-
-        # 添加变量名（在方框左侧）
-        var_label = Text(
-            f"{var_name} = ",
-            font="Courier New",
-            font_size=28,
-            color=self.VAR_NAME_COLOR
+        strip = ArrayStrip(
+            data,
+            stroke_color=self.SQUARE_COLOR,
+            font=self.CHINESE_FONT,
+            font_size=26,
+            text_color=self.TEXT_COLOR,
+            index_color=self.INDEX_COLOR,
+            var_name=var_name,
+            var_color=self.VAR_NAME_COLOR
         )
-
-        # 组合所有元素
-        list_group = VGroup(squares, numbers_text)
-        var_label.next_to(list_group, LEFT, buff=0.3)
-
         # 整体居中
-        full_group = VGroup(var_label, list_group, index_text)
-        full_group.move_to(position)
+        strip.move_to(position)
 
-        return var_label, squares, numbers_text, index_text
+        return strip.var_label, strip.squares, strip.numbers_text, strip.index_text
 
     def update_indices(self, squares, old_indices):
         """创建更新后的索引标签"""
         new_indices = VGroup()
         for i in range(len(squares)):
-            index = Text(
+            index = cached_text(
                 str(i),
                 font=self.CHINESE_FONT,
                 font_size=20,
@@ -97,6 +65,7 @@ class ListCRUDAnimation(Scene):
 
     def construct(self):
         # 标题
+        self.next_section("标题")
         title = Text(
             "Python 列表操作：增删查改",
             font=self.CHINESE_FONT,
@@ -108,6 +77,7 @@ class ListCRUDAnimation(Scene):
         self.wait(0.5)
 
         # ====== 第一部分：添加元素 ======
+        self.next_section("第一部分：添加元素")
         subtitle1 = Text(
             "1. 添加元素 (Create/Add)",
             font=self.CHINESE_FONT,
@@ -172,8 +142,8 @@ class ListCRUDAnimation(Scene):
 
         # 将新元素变为正常颜色
         self.play(
-            new_square.animate.set_stroke(color=self.SQUARE_COLOR),
-            new_number.animate.set_color(self.TEXT_COLOR)
+            SetStroke(new_square, color=self.SQUARE_COLOR),
+            SetColor(new_number, self.TEXT_COLOR)
         )
 
         # 更新组
@@ -207,8 +177,8 @@ class ListCRUDAnimation(Scene):
 
         # 高亮插入位置
         self.play(
-            squares[2].animate.set_stroke(color=self.HIGHLIGHT_COLOR, width=4),
-            index_text[2].animate.set_color(self.HIGHLIGHT_COLOR).scale(1.3)
+            SetStroke(squares[2], color=self.HIGHLIGHT_COLOR, width=4),
+            SetColor(index_text[2], self.HIGHLIGHT_COLOR, scale=1.3)
         )
         self.wait(0.5)
 
@@ -293,10 +263,10 @@ class ListCRUDAnimation(Scene):
 
         # 恢复正常颜色
         self.play(
-            squares[2].animate.set_stroke(color=self.SQUARE_COLOR, width=2),
-            insert_square.animate.set_stroke(color=self.SQUARE_COLOR),
-            insert_number.animate.set_color(self.TEXT_COLOR),
-            insert_index.animate.set_color(self.INDEX_COLOR),
+            SetStroke(squares[2], color=self.SQUARE_COLOR, width=2),
+            SetStroke(insert_square, color=self.SQUARE_COLOR),
+            SetColor(insert_number, self.TEXT_COLOR),
+            SetColor(insert_index, self.INDEX_COLOR),
             FadeOut(explain)
         )
 
@@ -313,6 +283,7 @@ class ListCRUDAnimation(Scene):
         )
 
         # ====== 第二部分：删除元素（重点：索引更新） ======
+        self.next_section("第二部分：删除元素（重点：索引更新）")
         subtitle2 = Text(
             "2. 删除元素 (Delete)",
             font=self.CHINESE_FONT,
@@ -359,9 +330,9 @@ class ListCRUDAnimation(Scene):
 
         # 高亮要删除的元素
         self.play(
-            squares2[2].animate.set_stroke(color=self.DELETE_COLOR, width=4),
-            numbers_text2[2].animate.set_color(self.DELETE_COLOR).scale(1.2),
-            index_text2[2].animate.set_color(self.DELETE_COLOR).scale(1.3)
+            SetStroke(squares2[2], color=self.DELETE_COLOR, width=4),
+            SetColor(numbers_text2[2], self.DELETE_COLOR, scale=1.2),
+            SetColor(index_text2[2], self.DELETE_COLOR, scale=1.3)
         )
         self.wait(0.8)
 
@@ -415,6 +386,7 @@ class ListCRUDAnimation(Scene):
         )
 
         # ====== 第三部分：修改元素 ======
+        self.next_section("第三部分：修改元素")
         subtitle3 = Text(
             "3. 修改元素 (Update)",
             font=self.CHINESE_FONT,
@@ -452,9 +424,9 @@ class ListCRUDAnimation(Scene):
 
         # 高亮要修改的元素
         self.play(
-            squares3[2].animate.set_stroke(color=self.HIGHLIGHT_COLOR, width=4),
-            numbers_text3[2].animate.set_color(self.HIGHLIGHT_COLOR).scale(1.3),
-            index_text3[2].animate.set_color(self.HIGHLIGHT_COLOR).scale(1.3)
+            SetStroke(squares3[2], color=self.HIGHLIGHT_COLOR, width=4),
+            SetColor(numbers_text3[2], self.HIGHLIGHT_COLOR, scale=1.3),
+            SetColor(index_text3[2], self.HIGHLIGHT_COLOR, scale=1.3)
         )
         self.wait(0.5)
 
@@ -470,9 +442,9 @@ class ListCRUDAnimation(Scene):
 
         # 恢复正常颜色
         self.play(
-            squares3[2].animate.set_stroke(color=self.SQUARE_COLOR, width=2),
-            numbers_text3[2].animate.set_color(self.TEXT_COLOR).scale(1/1.3),
-            index_text3[2].animate.set_color(self.INDEX_COLOR).scale(1/1.3)
+            SetStroke(squares3[2], color=self.SQUARE_COLOR, width=2),
+            SetColor(numbers_text3[2], self.TEXT_COLOR, scale=1/1.3),
+            SetColor(index_text3[2], self.INDEX_COLOR, scale=1/1.3)
         )
         self.wait(1)
 
@@ -486,6 +458,7 @@ class ListCRUDAnimation(Scene):
         )
 
         # ====== 第四部分：查找元素 ======
+        self.next_section("第四部分：查找元素")
         subtitle4 = Text(
             "4. 查找元素 (Read)",
             font=self.CHINESE_FONT,
@@ -521,16 +494,16 @@ class ListCRUDAnimation(Scene):
         self.play(Write(method5))
 
         self.play(
-            squares4[3].animate.set_stroke(color=self.HIGHLIGHT_COLOR, width=4),
-            numbers_text4[3].animate.set_color(self.HIGHLIGHT_COLOR).scale(1.3),
-            index_text4[3].animate.set_color(self.HIGHLIGHT_COLOR).scale(1.3)
+            SetStroke(squares4[3], color=self.HIGHLIGHT_COLOR, width=4),
+            SetColor(numbers_text4[3], self.HIGHLIGHT_COLOR, scale=1.3),
+            SetColor(index_text4[3], self.HIGHLIGHT_COLOR, scale=1.3)
         )
         self.wait(1.2)
 
         self.play(
-            squares4[3].animate.set_stroke(color=self.SQUARE_COLOR, width=2),
-            numbers_text4[3].animate.set_color(self.TEXT_COLOR).scale(1/1.3),
-            index_text4[3].animate.set_color(self.INDEX_COLOR).scale(1/1.3),
+            SetStroke(squares4[3], color=self.SQUARE_COLOR, width=2),
+            SetColor(numbers_text4[3], self.TEXT_COLOR, scale=1/1.3),
+            SetColor(index_text4[3], self.INDEX_COLOR, scale=1/1.3),
             FadeOut(method5)
         )
 
@@ -546,14 +519,14 @@ class ListCRUDAnimation(Scene):
 
         # 先高亮值30
         self.play(
-            squares4[2].animate.set_stroke(color=self.CODE_COLOR, width=4),
-            numbers_text4[2].animate.set_color(self.CODE_COLOR).scale(1.3)
+            SetStroke(squares4[2], color=self.CODE_COLOR, width=4),
+            SetColor(numbers_text4[2], self.CODE_COLOR, scale=1.3)
         )
         self.wait(0.5)
 
         # 然后高亮返回的索引
         self.play(
-            index_text4[2].animate.set_color(self.HIGHLIGHT_COLOR).scale(1.5)
+            SetColor(index_text4[2], self.HIGHLIGHT_COLOR, scale=1.5)
         )
         self.wait(1.5)
 
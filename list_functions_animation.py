@@ -1,9 +1,11 @@
 from manim import *
+from array_strip import ArrayStrip
+from style_animations import SetColor, SetStroke
 
 class ListFunctionsAnimation(Scene):
     """列表函数和方法动画：遍历、排序等"""
-    def __init__(self):
-        super().__init__()
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
         self.camera.background_color = "#FFFFFF"
 
         # 颜色方案
@@ -14,6 +16,7 @@ class ListFunctionsAnimation(Scene):
         self.CODE_COLOR = "#E67E22"
         self.SORT_COLOR = "#9B59B6"
 
+    def setup(self):
         # 创建水印
         watermark = Text(
             "作者：温程远",
@@ -26,41 +29,28 @@ class ListFunctionsAnimation(Scene):
 
     def create_list_visualization(self, data, position=ORIGIN):
         """创建列表可视化"""
-        squares = VGroup()
-        numbers_text = VGroup()
-
-        square_size = 0.7
-        stroke_width = 2
-
-        for i, num in enumerate(data):
-            square = Square(
-                side_length=square_size,
-                stroke_width=stroke_width,
-                stroke_color=self.SQUARE_COLOR
-            ).shift(RIGHT * i * (square_size + stroke_width/100))
-            squares.add(square)
-
-            number = Text(
-                str(num),
-                font="SimSun",
-                font_size=26,
-                color=self.TEXT_COLOR
-            ).move_to(square.get_center())
-            numbers_text.add(number)
-
-        array_group = VGroup(squares, numbers_text)
-        array_group.move_to(position)
+        strip = ArrayStrip(
+            data,
+            stroke_color=self.SQUARE_COLOR,
+            font="SimSun",
+            font_size=26,
+            text_color=self.TEXT_COLOR,
+            index_direction=None
+        )
+        strip.move_to(position)
 
-        return squares, numbers_text
+        return strip.squares, strip.numbers_text
 
     def construct(self):
         # 标题
+        self.next_section("标题")
         title = Text("Python 列表常用函数和方法", font="SimSun", color=self.TEXT_COLOR, font_size=44)
         title.to_edge(UP, buff=0.3)
         self.play(Write(title))
         self.wait(0.5)
 
         # ====== 第一部分：遍历列表 ======
+        self.next_section("第一部分：遍历列表")
         subtitle1 = Text("1. 遍历列表 (for循环)", font="SimSun", color=self.CODE_COLOR, font_size=32)
         subtitle1.next_to(title, DOWN, buff=0.4)
         self.play(Write(subtitle1))
@@ -83,14 +73,14 @@ class ListFunctionsAnimation(Scene):
         # 依次遍历每个元素
         for i in range(len(data1)):
             self.play(
-                squares1[i].animate.set_stroke(color=self.HIGHLIGHT_COLOR, width=4),
-                numbers_text1[i].animate.set_color(self.HIGHLIGHT_COLOR).scale(1.3),
+                SetStroke(squares1[i], color=self.HIGHLIGHT_COLOR, width=4),
+                SetColor(numbers_text1[i], self.HIGHLIGHT_COLOR, scale=1.3),
                 run_time=0.5
             )
             self.wait(0.3)
             self.play(
-                squares1[i].animate.set_stroke(color=self.SQUARE_COLOR, width=2),
-                numbers_text1[i].animate.set_color(self.TEXT_COLOR).scale(1/1.3),
+                SetStroke(squares1[i], color=self.SQUARE_COLOR, width=2),
+                SetColor(numbers_text1[i], self.TEXT_COLOR, scale=1/1.3),
                 run_time=0.3
             )
 
@@ -104,6 +94,7 @@ class ListFunctionsAnimation(Scene):
         )
 
         # ====== 第二部分：排序 ======
+        self.next_section("第二部分：排序")
         subtitle2 = Text("2. 排序 (sort & sorted)", font="SimSun", color=self.CODE_COLOR, font_size=32)
         subtitle2.next_to(title, DOWN, buff=0.4)
         self.play(Write(subtitle2))
@@ -128,35 +119,20 @@ class ListFunctionsAnimation(Scene):
         data_sorted = sorted(data2)
 
         # 创建排序后的新位置
-        sorted_squares = VGroup()
-        sorted_numbers = VGroup()
-
-        square_size = 0.7
-        stroke_width = 2
-
-        for i, num in enumerate(data_sorted):
-            square = Square(
-                side_length=square_size,
-                stroke_width=stroke_width,
-                stroke_color=self.SORT_COLOR
-            ).shift(RIGHT * i * (square_size + stroke_width/100))
-            sorted_squares.add(square)
-
-            number = Text(
-                str(num),
-                font="SimSun",
-                font_size=26,
-                color=self.SORT_COLOR
-            ).move_to(square.get_center())
-            sorted_numbers.add(number)
-
-        sorted_group = VGroup(sorted_squares, sorted_numbers)
-        sorted_group.move_to(ORIGIN + DOWN * 0.3)
+        sorted_strip = ArrayStrip(
+            data_sorted,
+            stroke_color=self.SORT_COLOR,
+            font="SimSun",
+            font_size=26,
+            text_color=self.SORT_COLOR,
+            index_direction=None
+        ).move_to(ORIGIN + DOWN * 0.3)
+        sorted_squares, sorted_numbers = sorted_strip.squares, sorted_strip.numbers_text
 
         # 高亮显示排序过程
         self.play(
-            *[squares2[i].animate.set_stroke(color=self.SORT_COLOR, width=3) for i in range(len(data2))],
-            *[numbers_text2[i].animate.set_color(self.SORT_COLOR) for i in range(len(data2))],
+            *[SetStroke(squares2[i], color=self.SORT_COLOR, width=3) for i in range(len(data2))],
+            *[SetColor(numbers_text2[i], self.SORT_COLOR) for i in range(len(data2))],
             run_time=1
         )
 
@@ -174,8 +150,8 @@ class ListFunctionsAnimation(Scene):
 
         # 恢复正常颜色
         self.play(
-            *[squares2[i].animate.set_stroke(color=self.SQUARE_COLOR, width=2) for i in range(len(data2))],
-            *[numbers_text2[i].animate.set_color(self.TEXT_COLOR) for i in range(len(data2))],
+            *[SetStroke(squares2[i], color=self.SQUARE_COLOR, width=2) for i in range(len(data2))],
+            *[SetColor(numbers_text2[i], self.TEXT_COLOR) for i in range(len(data2))],
             run_time=0.5
         )
 
@@ -189,6 +165,7 @@ class ListFunctionsAnimation(Scene):
         )
 
         # ====== 第三部分：反转 ======
+        self.next_section("第三部分：反转")
         subtitle3 = Text("3. 反转 (reverse)", font="SimSun", color=self.CODE_COLOR, font_size=32)
         subtitle3.next_to(title, DOWN, buff=0.4)
         self.play(Write(subtitle3))
@@ -227,6 +204,7 @@ class ListFunctionsAnimation(Scene):
         )
 
         # ====== 第四部分：其他常用方法 ======
+        self.next_section("第四部分：其他常用方法")
         subtitle4 = Text("4. 其他常用方法", font="SimSun", color=self.CODE_COLOR, font_size=32)
         subtitle4.next_to(title, DOWN, buff=0.4)
         self.play(Write(subtitle4))
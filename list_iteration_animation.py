@@ -1,9 +1,11 @@
 from manim import *
+from array_strip import ArrayStrip
+from style_animations import SetColor, SetStroke
 
 class ListIterationAnimation(Scene):
     """列表遍历动画 - 两种遍历方式对比"""
-    def __init__(self):
-        super().__init__()
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
         self.camera.background_color = "#FFFFFF"
 
         # 颜色方案
@@ -18,6 +20,7 @@ class ListIterationAnimation(Scene):
         # 使用更好的中文字体
         self.CHINESE_FONT = "Microsoft YaHei"
 
+    def setup(self):
         # 创建水印
         watermark = Text(
             "作者：温程远",
@@ -30,58 +33,25 @@ class ListIterationAnimation(Scene):
 
     def create_list_visualization(self, data, var_name="my_list", position=ORIGIN):
         """创建列表可视化"""
-        squares = VGroup()
-        numbers_text = VGroup()
-
-        square_size = 0.7
-        stroke_width = 2
-
-        for i, num in enumerate(data):
-            square = Square(
-                side_length=square_size,
-                stroke_width=stroke_width,
-                stroke_color=self.SQUARE_COLOR
-            ).shift(RIGHT * i * (square_size + 0.02))
-            squares.add(square)
-
-            number = Text(
-                str(num),
-                font=self.CHINESE_FONT,
-                font_size=26,
-                color=self.TEXT_COLOR
-            ).move_to(square.get_center())
-            numbers_text.add(number)
-
-        # 添加索引（在方框上方）
-        index_text = VGroup()
-        for i in range(len(data)):
-            index = Text(
-                str(i),
-                font=self.CHINESE_FONT,
-                font_size=20,
-                color=self.INDEX_COLOR
-            ).next_to(squares[i], UP, buff=0.2)
-            index_text.add(index)
-
-        # 添加变量名
-        var_label = Text(
-            f"{var_name} = ",
-            font="Courier New",
-            font_size=28,
-            color=self.VAR_NAME_COLOR
+        strip = ArrayStrip(
+            data,
+            stroke_color=self.SQUARE_COLOR,
+            font=self.CHINESE_FONT,
+            font_size=26,
+            text_color=self.TEXT_COLOR,
+            index_direction=UP,
+            index_color=self.INDEX_COLOR,
+            var_name=var_name,
+            var_color=self.VAR_NAME_COLOR
         )
-
-        list_group = VGroup(squares, numbers_text)
-        var_label.next_to(list_group, LEFT, buff=0.3)
-
         # 整体居中
-        full_group = VGroup(var_label, list_group, index_text)
-        full_group.move_to(position)
+        strip.move_to(position)
 
-        return var_label, squares, numbers_text, index_text
+        return strip.var_label, strip.squares, strip.numbers_text, strip.index_text
 
     def construct(self):
         # 标题
+        self.next_section("标题")
         title = Text(
             "Python 列表遍历",
             font=self.CHINESE_FONT,
@@ -93,6 +63,7 @@ class ListIterationAnimation(Scene):
         self.wait(0.5)
 
         # ====== 场景1：传统索引遍历 ======
+        self.next_section("场景1：传统索引遍历")
         subtitle1 = Text(
             "方法1：传统索引遍历",
             font=self.CHINESE_FONT,
@@ -160,15 +131,15 @@ class ListIterationAnimation(Scene):
 
             # 高亮当前索引
             self.play(
-                index_text[i].animate.set_color(self.HIGHLIGHT_COLOR).scale(1.5),
+                SetColor(index_text[i], self.HIGHLIGHT_COLOR, scale=1.5),
                 run_time=0.3
             )
             self.wait(0.2)
 
             # 高亮对应元素
             self.play(
-                squares[i].animate.set_stroke(color=self.HIGHLIGHT_COLOR, width=4),
-                numbers_text[i].animate.set_color(self.HIGHLIGHT_COLOR).scale(1.3),
+                SetStroke(squares[i], color=self.HIGHLIGHT_COLOR, width=4),
+                SetColor(numbers_text[i], self.HIGHLIGHT_COLOR, scale=1.3),
                 run_time=0.3
             )
             self.wait(0.3)
@@ -187,9 +158,9 @@ class ListIterationAnimation(Scene):
 
             # 恢复高亮
             self.play(
-                index_text[i].animate.set_color(self.INDEX_COLOR).scale(1/1.5),
-                squares[i].animate.set_stroke(color=self.SQUARE_COLOR, width=2),
-                numbers_text[i].animate.set_color(self.TEXT_COLOR).scale(1/1.3),
+                SetColor(index_text[i], self.INDEX_COLOR, scale=1/1.5),
+                SetStroke(squares[i], color=self.SQUARE_COLOR, width=2),
+                SetColor(numbers_text[i], self.TEXT_COLOR, scale=1/1.3),
                 run_time=0.3
             )
 
@@ -209,6 +180,7 @@ class ListIterationAnimation(Scene):
         )
 
         # ====== 场景2：直接遍历元素 ======
+        self.next_section("场景2：直接遍历元素")
         subtitle2 = Text(
             "方法2：直接遍历元素",
             font=self.CHINESE_FONT,
@@ -270,8 +242,8 @@ class ListIterationAnimation(Scene):
         for i in range(len(data)):
             # 高亮当前元素
             self.play(
-                squares2[i].animate.set_stroke(color=self.ITEM_COLOR, width=4),
-                numbers_text2[i].animate.set_color(self.ITEM_COLOR).scale(1.4),
+                SetStroke(squares2[i], color=self.ITEM_COLOR, width=4),
+                SetColor(numbers_text2[i], self.ITEM_COLOR, scale=1.4),
                 run_time=0.4
             )
             self.wait(0.2)
@@ -306,8 +278,8 @@ class ListIterationAnimation(Scene):
 
             # 恢复高亮
             self.play(
-                squares2[i].animate.set_stroke(color=self.SQUARE_COLOR, width=2),
-                numbers_text2[i].animate.set_color(self.TEXT_COLOR).scale(1/1.4),
+                SetStroke(squares2[i], color=self.SQUARE_COLOR, width=2),
+                SetColor(numbers_text2[i], self.TEXT_COLOR, scale=1/1.4),
                 run_time=0.3
             )
 
@@ -327,6 +299,7 @@ class ListIterationAnimation(Scene):
         )
 
         # ====== 总结对比 ======
+        self.next_section("总结对比")
         summary_title = Text(
             "两种方法对比",
             font=self.CHINESE_FONT,
@@ -1,9 +1,11 @@
 from manim import *
+from array_strip import ArrayStrip
+from style_animations import SetColor, SetStroke
 
 class ListSlicingAnimation(Scene):
     """列表切片操作动画"""
-    def __init__(self):
-        super().__init__()
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
         self.camera.background_color = "#FFFFFF"
 
         # 颜色方案
@@ -14,6 +16,7 @@ class ListSlicingAnimation(Scene):
         self.CODE_COLOR = "#E67E22"
         self.SLICE_COLOR = "#9B59B6"
 
+    def setup(self):
         # 创建水印
         watermark = Text(
             "作者:温程远",
@@ -25,64 +28,35 @@ class ListSlicingAnimation(Scene):
         self.add(watermark)
 
     def create_list_visualization(self, data, position=ORIGIN):
-        """创建列表可视化"""
-        squares = VGroup()
-        numbers_text = VGroup()
-
-        square_size = 0.65
-        stroke_width = 2
-
-        for i, num in enumerate(data):
-            square = Square(
-                side_length=square_size,
-                stroke_width=stroke_width,
-                stroke_color=self.SQUARE_COLOR
-            ).shift(RIGHT * i * (square_size + stroke_width/100))
-            squares.add(square)
-
-            number = Text(
-                str(num),
-                font="SimSun",
-                font_size=24,
-                color=self.TEXT_COLOR
-            ).move_to(square.get_center())
-            numbers_text.add(number)
-
-        array_group = VGroup(squares, numbers_text)
-        array_group.move_to(position)
-
-        # 添加正向索引
-        index_text = VGroup()
-        for i in range(len(data)):
-            index = Text(
-                str(i),
-                font="SimSun",
-                font_size=18,
-                color=self.INDEX_COLOR
-            ).next_to(squares[i], UP, buff=0.12)
-            index_text.add(index)
-
-        # 添加负向索引
-        neg_index_text = VGroup()
-        for i in range(len(data)):
-            neg_index = Text(
-                str(i - len(data)),
-                font="SimSun",
-                font_size=18,
-                color="#E74C3C"
-            ).next_to(squares[i], DOWN, buff=0.12)
-            neg_index_text.add(neg_index)
-
-        return squares, numbers_text, index_text, neg_index_text
+        """创建列表可视化（上方为正向索引，下方为负向索引）"""
+        strip = ArrayStrip(
+            data,
+            square_size=0.65,
+            stroke_color=self.SQUARE_COLOR,
+            font="SimSun",
+            font_size=24,
+            text_color=self.TEXT_COLOR,
+            index_direction=UP,
+            index_buff=0.12,
+            index_font_size=18,
+            index_color=self.INDEX_COLOR,
+            show_neg_index=True,
+            neg_index_color="#E74C3C"
+        )
+        strip.move_cells_to(position)
+
+        return strip.squares, strip.numbers_text, strip.index_text, strip.neg_index_text
 
     def construct(self):
         # 标题
+        self.next_section("标题")
         title = Text("Python 列表切片", font="SimSun", color=self.TEXT_COLOR, font_size=44)
         title.to_edge(UP, buff=0.3)
         self.play(Write(title))
         self.wait(0.5)
 
         # ====== 第一部分：基本切片 ======
+        self.next_section("第一部分：基本切片")
         subtitle1 = Text("1. 基本切片语法 [start:stop:step]", font="SimSun", color=self.CODE_COLOR, font_size=32)
         subtitle1.next_to(title, DOWN, buff=0.4)
         self.play(Write(subtitle1))
@@ -110,8 +84,8 @@ class ListSlicingAnimation(Scene):
         # 高亮切片范围
         for i in range(2, 7):
             self.play(
-                squares[i].animate.set_stroke(color=self.SLICE_COLOR, width=4),
-                numbers_text[i].animate.set_color(self.SLICE_COLOR),
+                SetStroke(squares[i], color=self.SLICE_COLOR, width=4),
+                SetColor(numbers_text[i], self.SLICE_COLOR),
                 run_time=0.3
             )
 
@@ -120,8 +94,8 @@ class ListSlicingAnimation(Scene):
         # 恢复
         for i in range(2, 7):
             self.play(
-                squares[i].animate.set_stroke(color=self.SQUARE_COLOR, width=2),
-                numbers_text[i].animate.set_color(self.TEXT_COLOR),
+                SetStroke(squares[i], color=self.SQUARE_COLOR, width=2),
+                SetColor(numbers_text[i], self.TEXT_COLOR),
                 run_time=0.2
             )
 
@@ -134,8 +108,8 @@ class ListSlicingAnimation(Scene):
 
         for i in range(0, 5):
             self.play(
-                squares[i].animate.set_stroke(color=self.HIGHLIGHT_COLOR, width=4),
-                numbers_text[i].animate.set_color(self.HIGHLIGHT_COLOR),
+                SetStroke(squares[i], color=self.HIGHLIGHT_COLOR, width=4),
+                SetColor(numbers_text[i], self.HIGHLIGHT_COLOR),
                 run_time=0.3
             )
 
@@ -143,8 +117,8 @@ class ListSlicingAnimation(Scene):
 
         for i in range(0, 5):
             self.play(
-                squares[i].animate.set_stroke(color=self.SQUARE_COLOR, width=2),
-                numbers_text[i].animate.set_color(self.TEXT_COLOR),
+                SetStroke(squares[i], color=self.SQUARE_COLOR, width=2),
+                SetColor(numbers_text[i], self.TEXT_COLOR),
                 run_time=0.2
             )
 
@@ -157,8 +131,8 @@ class ListSlicingAnimation(Scene):
 
         for i in range(6, 10):
             self.play(
-                squares[i].animate.set_stroke(color=self.CODE_COLOR, width=4),
-                numbers_text[i].animate.set_color(self.CODE_COLOR),
+                SetStroke(squares[i], color=self.CODE_COLOR, width=4),
+                SetColor(numbers_text[i], self.CODE_COLOR),
                 run_time=0.3
             )
 
@@ -166,14 +140,15 @@ class ListSlicingAnimation(Scene):
 
         for i in range(6, 10):
             self.play(
-                squares[i].animate.set_stroke(color=self.SQUARE_COLOR, width=2),
-                numbers_text[i].animate.set_color(self.TEXT_COLOR),
+                SetStroke(squares[i], color=self.SQUARE_COLOR, width=2),
+                SetColor(numbers_text[i], self.TEXT_COLOR),
                 run_time=0.2
             )
 
         self.play(FadeOut(example3), FadeOut(subtitle1))
 
         # ====== 第二部分：步长切片 ======
+        self.next_section("第二部分：步长切片")
         subtitle2 = Text("2. 使用步长 (Step)", font="SimSun", color=self.CODE_COLOR, font_size=32)
         subtitle2.next_to(title, DOWN, buff=0.4)
         self.play(Write(subtitle2))
@@ -185,8 +160,8 @@ class ListSlicingAnimation(Scene):
 
         for i in range(0, 10, 2):
             self.play(
-                squares[i].animate.set_stroke(color=self.SLICE_COLOR, width=4),
-                numbers_text[i].animate.set_color(self.SLICE_COLOR).scale(1.2),
+                SetStroke(squares[i], color=self.SLICE_COLOR, width=4),
+                SetColor(numbers_text[i], self.SLICE_COLOR, scale=1.2),
                 run_time=0.4
             )
 
@@ -194,8 +169,8 @@ class ListSlicingAnimation(Scene):
 
         for i in range(0, 10, 2):
             self.play(
-                squares[i].animate.set_stroke(color=self.SQUARE_COLOR, width=2),
-                numbers_text[i].animate.set_color(self.TEXT_COLOR).scale(1/1.2),
+                SetStroke(squares[i], color=self.SQUARE_COLOR, width=2),
+                SetColor(numbers_text[i], self.TEXT_COLOR, scale=1/1.2),
                 run_time=0.2
             )
 
@@ -208,8 +183,8 @@ class ListSlicingAnimation(Scene):
 
         for i in range(1, 10, 3):
             self.play(
-                squares[i].animate.set_stroke(color=self.HIGHLIGHT_COLOR, width=4),
-                numbers_text[i].animate.set_color(self.HIGHLIGHT_COLOR).scale(1.2),
+                SetStroke(squares[i], color=self.HIGHLIGHT_COLOR, width=4),
+                SetColor(numbers_text[i], self.HIGHLIGHT_COLOR, scale=1.2),
                 run_time=0.4
             )
 
@@ -217,14 +192,15 @@ class ListSlicingAnimation(Scene):
 
         for i in range(1, 10, 3):
             self.play(
-                squares[i].animate.set_stroke(color=self.SQUARE_COLOR, width=2),
-                numbers_text[i].animate.set_color(self.TEXT_COLOR).scale(1/1.2),
+                SetStroke(squares[i], color=self.SQUARE_COLOR, width=2),
+                SetColor(numbers_text[i], self.TEXT_COLOR, scale=1/1.2),
                 run_time=0.2
             )
 
         self.play(FadeOut(example5), FadeOut(subtitle2))
 
         # ====== 第三部分：反向切片 ======
+        self.next_section("第三部分：反向切片")
         subtitle3 = Text("3. 反向切片", font="SimSun", color=self.CODE_COLOR, font_size=32)
         subtitle3.next_to(title, DOWN, buff=0.4)
         self.play(Write(subtitle3))
@@ -237,8 +213,8 @@ class ListSlicingAnimation(Scene):
         # 从右到左依次高亮
         for i in range(9, -1, -1):
             self.play(
-                squares[i].animate.set_stroke(color="#E74C3C", width=4),
-                numbers_text[i].animate.set_color("#E74C3C").scale(1.2),
+                SetStroke(squares[i], color="#E74C3C", width=4),
+                SetColor(numbers_text[i], "#E74C3C", scale=1.2),
                 run_time=0.3
             )
 
@@ -246,8 +222,8 @@ class ListSlicingAnimation(Scene):
 
         for i in range(10):
             self.play(
-                squares[i].animate.set_stroke(color=self.SQUARE_COLOR, width=2),
-                numbers_text[i].animate.set_color(self.TEXT_COLOR).scale(1/1.2),
+                SetStroke(squares[i], color=self.SQUARE_COLOR, width=2),
+                SetColor(numbers_text[i], self.TEXT_COLOR, scale=1/1.2),
                 run_time=0.15
             )
 
@@ -260,9 +236,9 @@ class ListSlicingAnimation(Scene):
 
         for i in range(7, 10):
             self.play(
-                squares[i].animate.set_stroke(color=self.SLICE_COLOR, width=4),
-                numbers_text[i].animate.set_color(self.SLICE_COLOR),
-                neg_index_text[i].animate.set_color(self.SLICE_COLOR).scale(1.3),
+                SetStroke(squares[i], color=self.SLICE_COLOR, width=4),
+                SetColor(numbers_text[i], self.SLICE_COLOR),
+                SetColor(neg_index_text[i], self.SLICE_COLOR, scale=1.3),
                 run_time=0.4
             )
 
@@ -1,9 +1,11 @@
 from manim import *
+from array_strip import ArrayStrip
+from style_animations import SetStroke
 
 class ListSortAnimation(Scene):
     """列表排序动画 - sort() vs sorted() 对比"""
-    def __init__(self):
-        super().__init__()
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
         self.camera.background_color = "#FFFFFF"
 
         # 颜色方案
@@ -18,6 +20,7 @@ class ListSortAnimation(Scene):
         # 使用更好的中文字体
         self.CHINESE_FONT = "Microsoft YaHei"
 
+    def setup(self):
         # 创建水印
         watermark = Text(
             "作者：温程远",
@@ -30,49 +33,29 @@ class ListSortAnimation(Scene):
 
     def create_list_visualization(self, data, var_name="my_list", position=ORIGIN, color=None):
         """创建列表可视化"""
-        squares = VGroup()
-        numbers_text = VGroup()
-
-        square_size = 0.65
-        stroke_width = 2
         if color is None:
             color = self.SQUARE_COLOR
 
-        for i, num in enumerate(data):
-            square = Square(
-                side_length=square_size,
-                stroke_width=stroke_width,
-                stroke_color=color
-            ).shift(RIGHT * i * (square_size + 0.02))
-            squares.add(square)
-
-            number = Text(
-                str(num),
-                font=self.CHINESE_FONT,
-                font_size=24,
-                color=self.TEXT_COLOR
-            ).move_to(square.get_center())
-            numbers_text.add(number)
-
-        # 添加变量名
-        var_label = Text(
-            f"{var_name} = ",
-            font="Courier New",
-            font_size=26,
-            color=self.VAR_NAME_COLOR
+        strip = ArrayStrip(
+            data,
+            square_size=0.65,
+            stroke_color=color,
+            font=self.CHINESE_FONT,
+            font_size=24,
+            text_color=self.TEXT_COLOR,
+            index_direction=None,
+            var_name=var_name,
+            var_font_size=26,
+            var_color=self.VAR_NAME_COLOR
         )
-
-        list_group = VGroup(squares, numbers_text)
-        var_label.next_to(list_group, LEFT, buff=0.3)
-
         # 整体定位
-        full_group = VGroup(var_label, list_group)
-        full_group.move_to(position)
+        strip.move_to(position)
 
-        return var_label, squares, numbers_text
+        return strip.var_label, strip.squares, strip.numbers_text
 
     def construct(self):
         # 标题
+        self.next_section("标题")
         title = Text(
             "Python 列表排序：sort() vs sorted()",
             font=self.CHINESE_FONT,
@@ -84,6 +67,7 @@ class ListSortAnimation(Scene):
         self.wait(0.5)
 
         # ====== 场景1：list.sort() - 原地排序 ======
+        self.next_section("场景1：list.sort() - 原地排序")
         subtitle1 = Text(
             "方法1：list.sort() - 原地排序",
             font=self.CHINESE_FONT,
@@ -131,7 +115,7 @@ class ListSortAnimation(Scene):
 
         # 高亮所有元素准备排序
         self.play(
-            *[squares1[i].animate.set_stroke(color=self.SORT_COLOR, width=3) for i in range(len(data1))],
+            *[SetStroke(squares1[i], color=self.SORT_COLOR, width=3) for i in range(len(data1))],
             run_time=0.8
         )
         self.wait(0.5)
@@ -213,6 +197,7 @@ class ListSortAnimation(Scene):
         )
 
         # ====== 场景2：sorted() - 返回新列表 ======
+        self.next_section("场景2：sorted() - 返回新列表")
         subtitle2 = Text(
             "方法2：sorted() - 返回新列表",
             font=self.CHINESE_FONT,
@@ -260,7 +245,7 @@ class ListSortAnimation(Scene):
 
         # 高亮原列表
         self.play(
-            *[squares2[i].animate.set_stroke(color=self.HIGHLIGHT_COLOR, width=3) for i in range(len(data2))],
+            *[SetStroke(squares2[i], color=self.HIGHLIGHT_COLOR, width=3) for i in range(len(data2))],
             run_time=0.8
         )
         self.wait(0.5)
@@ -305,7 +290,7 @@ class ListSortAnimation(Scene):
 
         # 在新列表上排序
         self.play(
-            *[temp_squares[i].animate.set_stroke(color=self.SORTED_COLOR, width=3) for i in range(len(data2))],
+            *[SetStroke(temp_squares[i], color=self.SORTED_COLOR, width=3) for i in range(len(data2))],
             run_time=0.8
         )
 
@@ -352,6 +337,7 @@ class ListSortAnimation(Scene):
         )
 
         # ====== 总结对比 ======
+        self.next_section("总结对比")
         summary_title = Text(
             "总结对比",
             font=self.CHINESE_FONT,
@@ -1,7 +1,23 @@
-from moviepy import VideoFileClip, concatenate_videoclips
+from moviepy import VideoFileClip
+from moviepy.video.io.ffmpeg_writer import FFMPEG_VideoWriter
+import argparse
+import json
 import os
+import subprocess
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 
+# 判断能否无损拼接时需要一致的流参数
+STREAM_KEYS = (
+    "codec_type", "codec_name", "profile", "width", "height", "pix_fmt",
+    "r_frame_rate", "time_base", "sample_rate", "channels",
+)
+
+# 记录每个输出文件对应的输入指纹，输入未变化的组不再重新合并
+MANIFEST_PATH = "merge_manifest.json"
+
 def get_file_creation_time(file_path):
     """获取文件的创建时间"""
     if os.name == 'nt':  # Windows
@@ -23,6 +39,74 @@ def list_mp4_files(folder_path):
     mp4_files.sort(key=lambda x: x[1])
     return [file_info[0] for file_info in mp4_files]
 
+def read_partial_file_list(folder_path):
+    """按 manim 写出的 partial_movie_file_list.txt 返回片段的播放顺序
+
+    该文件是 manim 拼接整段视频时使用的 ffmpeg concat 列表，顺序即 play/wait 的调用顺序，
+    不受并行渲染、复制文件或时钟偏差影响。文件不存在时返回 None。
+    注意：开启 save_sections 时 manim 拼接每个小节视频都会重写该文件，
+    最后留下的只是最后一个小节的片段，此时应按小节名分组（见 resolve_group）。
+    """
+    list_path = os.path.join(folder_path, "partial_movie_file_list.txt")
+    if not os.path.exists(list_path):
+        return None
+
+    video_files = []
+    with open(list_path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line.startswith("file "):
+                continue
+            path = line[len("file "):].strip("'")
+            if path.startswith("file:"):
+                path = path[len("file:"):]
+            # 文件夹被整体移动过时，按文件名在当前文件夹中查找
+            if not os.path.exists(path):
+                path = os.path.join(folder_path, os.path.basename(path))
+            video_files.append(path)
+    return video_files
+
+def load_partial_files(folder_path):
+    """片段列表：优先使用 manim 的清单，没有清单时才按创建时间排序"""
+    video_files = read_partial_file_list(folder_path)
+    if video_files is None:
+        print("未找到 partial_movie_file_list.txt，按文件创建时间排序")
+        video_files = list_mp4_files(folder_path)
+    return video_files
+
+def load_section_index(folder_path):
+    """读取 manim 的小节清单（需开启 save_sections），返回 {小节名: 小节视频路径}
+
+    片段文件夹为 .../partial_movie_files/<场景名>，小节清单位于 .../sections/<场景名>.json。
+    """
+    folder_path = os.path.normpath(folder_path)
+    scene_name = os.path.basename(folder_path)
+    sections_dir = os.path.join(os.path.dirname(os.path.dirname(folder_path)), "sections")
+    index_path = os.path.join(sections_dir, scene_name + ".json")
+    if not os.path.exists(index_path):
+        return {}
+
+    with open(index_path, encoding="utf-8") as f:
+        sections = json.load(f)
+    return {section["name"]: os.path.join(sections_dir, section["video"]) for section in sections}
+
+def resolve_group(spec, video_files, section_index):
+    """把合并组的声明转换为视频文件列表
+
+    spec 为小节名列表（推荐）或 (起始序号, 结束序号) 元组（兼容旧写法，含两端）。
+    序号写法只适用于未开启 save_sections 渲染的场景：有小节清单时
+    partial_movie_file_list.txt 只列出最后一个小节的片段，序号会对应到错误的文件，因此直接报错。
+    """
+    if isinstance(spec, tuple):
+        if section_index:
+            raise ValueError(f"{spec}：该场景按小节渲染（save_sections），片段序号不可靠，请改用小节名分组")
+        start_idx, end_idx = spec
+        return video_files[start_idx:end_idx + 1]
+    missing = [name for name in spec if name not in section_index]
+    if missing:
+        raise KeyError(f"未找到小节：{', '.join(missing)}")
+    return [section_index[name] for name in spec]
+
 def print_video_list(video_files):
     """打印视频列表（包含创建时间）"""
     print("\n可用的视频文件：")
@@ -54,68 +138,233 @@ def select_videos(video_files):
     
     return [video_files[i] for i in selected_indices]
 
-def merge_videos(selected_videos, output_path):
-    """合并选中的视频"""
+def probe_streams(video_path):
+    """用 ffprobe 读取视频各个流的关键参数"""
+    result = subprocess.run(
+        ["ffprobe", "-v", "error", "-show_entries", "stream=" + ",".join(STREAM_KEYS),
+         "-of", "json", video_path],
+        capture_output=True, text=True, check=True
+    )
+    streams = json.loads(result.stdout).get("streams", [])
+    return tuple(tuple(str(stream.get(key)) for key in STREAM_KEYS) for stream in streams)
+
+def can_stream_copy(selected_videos):
+    """所有视频的流参数完全一致时才能直接拼接（manim 的片段通常都满足）"""
+    params = {probe_streams(video) for video in selected_videos}
+    return len(params) == 1
+
+def concat_copy(selected_videos, output_path):
+    """使用 ffmpeg concat 分离器直接拼接码流，不重新编码"""
+    fd, list_path = tempfile.mkstemp(suffix=".txt", text=True)
     try:
-        print("\n开始合并视频...")
-        clips = [VideoFileClip(video) for video in selected_videos]
-        final_clip = concatenate_videoclips(clips)
-        
-        print("正在导出合并后的视频...")
-        final_clip.write_videofile(
-            output_path,
-            codec='libx264',
-            audio_codec='aac'
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            for video in selected_videos:
+                path = os.path.abspath(video).replace("\\", "/").replace("'", "'\\''")
+                f.write(f"file '{path}'\n")
+        subprocess.run(
+            ["ffmpeg", "-y", "-v", "error", "-f", "concat", "-safe", "0", "-i", list_path,
+             "-c", "copy", "-movflags", "+faststart", output_path],
+            check=True
         )
-        
-        # 清理资源
-        final_clip.close()
-        for clip in clips:
-            clip.close()
-            
+    finally:
+        os.remove(list_path)
+
+def concat_streaming(selected_videos, output_path, threads=None):
+    """流式重新编码：同一时间只打开一个输入，逐帧写入同一个编码器
+
+    内存占用与片段数量无关。所有片段按第一个片段的分辨率和帧率输出；
+    manim 的片段没有音轨，这里只合并画面。
+    """
+    first = VideoFileClip(selected_videos[0], audio=False)
+    size, fps = first.size, first.fps
+    first.close()
+
+    writer = FFMPEG_VideoWriter(output_path, size, fps, codec="libx264", threads=threads)
+    try:
+        for video in selected_videos:
+            clip = VideoFileClip(video, audio=False, target_resolution=tuple(size))
+            try:
+                for frame in clip.iter_frames(fps=fps, dtype="uint8"):
+                    writer.write_frame(frame)
+            finally:
+                clip.close()
+    finally:
+        writer.close()
+
+def peak_rss_mb():
+    """峰值内存 (本进程, 已结束子进程中的最大值)，单位 MB，不支持的平台返回 None"""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    # Linux 上 ru_maxrss 的单位为 KB，macOS 上为字节
+    unit = 1 if sys.platform == "darwin" else 1024
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * unit
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * unit
+    return own / 1024 ** 2, children / 1024 ** 2
+
+def merge_videos(selected_videos, output_path, stream_copy=True, threads=None):
+    """合并选中的视频，返回是否成功
+
+    stream_copy=True 时先检查流参数，一致则无损直接拼接（几秒完成），
+    参数不一致或 ffmpeg 不可用时才回退到流式重新编码，threads 为编码线程数。
+    """
+    if stream_copy:
+        try:
+            if can_stream_copy(selected_videos):
+                print("\n流参数一致，直接拼接（不重新编码）...")
+                concat_copy(selected_videos, output_path)
+                print(f"\n视频合并完成！已保存至：{output_path}")
+                return True
+            print("\n视频流参数不一致，改为重新编码")
+        except (OSError, subprocess.CalledProcessError) as e:
+            print(f"\n无法直接拼接（{e}），改为重新编码")
+
+    try:
+        print("\n开始合并视频（逐个读取，重新编码）...")
+        concat_streaming(selected_videos, output_path, threads)
         print(f"\n视频合并完成！已保存至：{output_path}")
-        
+        return True
     except Exception as e:
         print(f"合并过程中出错：{str(e)}")
-        # 确保清理资源
-        try:
-            final_clip.close()
-            for clip in clips:
-                clip.close()
-        except:
-            pass
+        return False
+
+def input_fingerprint(selected_videos, stream_copy):
+    """输入文件的指纹：路径、大小和修改时间（不读取文件内容），以及合并方式
+
+    manim 重新渲染某个片段时会重写该文件，大小或修改时间随之变化。
+    """
+    files = []
+    for video in selected_videos:
+        stat = os.stat(video)
+        files.append([os.path.abspath(video), stat.st_size, stat.st_mtime_ns])
+    return {"stream_copy": stream_copy, "inputs": files}
+
+def load_manifest(manifest_path):
+    try:
+        with open(manifest_path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_manifest(manifest_path, manifest):
+    """先写临时文件再替换，中途中断也不会留下损坏的清单"""
+    tmp_path = manifest_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, manifest_path)
+
+def merge_all_groups(merge_groups, jobs=None, stream_copy=True, manifest_path=MANIFEST_PATH, force=False):
+    """用有界线程池同时合并多个组（{输出文件: 视频列表}），返回失败的输出文件列表
+
+    实际的解码/编码在 ffmpeg 子进程中进行，线程只负责调度。
+    每个组分到 CPU核心数 / 并行组数 个编码线程，避免超额占用或闲置。
+    输出文件仍存在且输入指纹与清单记录一致的组会被跳过（force=True 时不跳过）。
+    """
+    manifest = load_manifest(manifest_path)
+    fingerprints = {}
+    pending = {}
+    for output_path, selected_videos in merge_groups.items():
+        fingerprints[output_path] = input_fingerprint(selected_videos, stream_copy)
+        unchanged = manifest.get(os.path.abspath(output_path)) == fingerprints[output_path]
+        if unchanged and os.path.exists(output_path) and not force:
+            print(f"[跳过] {output_path}（输入未变化）")
+        else:
+            pending[output_path] = selected_videos
+
+    if not pending:
+        print("\n所有合并组的输入均未变化，无需合并")
+        return []
+    merge_groups = pending
+
+    cpu_count = os.cpu_count() or 1
+    jobs = max(1, min(jobs or cpu_count, len(merge_groups)))
+    threads = max(1, cpu_count // jobs)
+    print(f"\n共 {len(merge_groups)} 组，并行 {jobs} 组，每组编码线程数 {threads}")
 
-def main():
+    failed = []
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        futures = {}
+        for output_path, selected_videos in merge_groups.items():
+            print(f"\n处理 {output_path}（{len(selected_videos)} 个视频）...")
+            future = executor.submit(merge_videos, selected_videos, output_path, stream_copy, threads)
+            futures[future] = output_path
+        for future in as_completed(futures):
+            output_path = futures[future]
+            if future.result():
+                manifest[os.path.abspath(output_path)] = fingerprints[output_path]
+                save_manifest(manifest_path, manifest)
+            else:
+                failed.append(output_path)
+    return failed
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="按组合并 manim 渲染的视频片段")
+    parser.add_argument("folder", nargs="?",
+                        default=r"E:\Projects\manimProj\BinarySplit\media\videos\1440p60\partial_movie_files\BinarySearchAnimation",
+                        help="视频片段所在文件夹")
+    parser.add_argument("--reencode", action="store_true",
+                        help="总是用 moviepy 重新编码（默认流参数一致时直接拼接）")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="同时合并的组数（默认等于CPU核心数，不超过组数）")
+    parser.add_argument("--force", action="store_true",
+                        help=f"忽略 {MANIFEST_PATH}，重新合并所有组")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
     # 设置文件夹路径
-    folder_path = r"E:\Projects\manimProj\BinarySplit\media\videos\1440p60\partial_movie_files\BinarySearchAnimation"
+    folder_path = args.folder
 
     if not os.path.exists(folder_path):
         print("文件夹不存在！")
         return
     
-    # 获取所有MP4文件
-    video_files = list_mp4_files(folder_path)
-    if not video_files:
-        print("未找到MP4文件！")
-        return
-    
-    # 定义要合并的视频组
+    # 定义要合并的视频组（按 BinarySearchAnimation 中 self.next_section 的小节名）
+    # 注意：与原来按片段序号的分组（merge1 为 0-4 …）相比，边界只差一处：
+    # 第1轮“计算mid”的第一个动画（low/high 方块描边变色，原片段 4）原来在 merge1 末尾，
+    # 现在整个“第1轮-计算mid”小节都在 merge2 开头。其余各组与原来的片段区间一致。
+    # 小节是最小的分组单位；场景按小节渲染后不能再用片段序号分组（见 resolve_group）。
     merge_groups = {
-        "merge1.mp4": (0, 4),    # 0-4
-        "merge2.mp4": (5, 9),    # 5-9
-        "merge3.mp4": (10, 15),  # 10-15
-        "merge4.mp4": (16, 18),  # 16-18
-        "merge5.mp4": (19, 24),  # 19-24
-        "merge6.mp4": (25, 27),  # 25-27
-        "merge7.mp4": (28, 33),  # 28-33
-        "merge8.mp4": (34, 36),  # 34-36
+        "merge1.mp4": ["开场"],
+        "merge2.mp4": ["第1轮-计算mid", "第1轮-比较"],
+        "merge3.mp4": ["第1轮-缩小范围", "第2轮-计算mid"],
+        "merge4.mp4": ["第2轮-比较"],
+        "merge5.mp4": ["第2轮-缩小范围", "第3轮-计算mid"],
+        "merge6.mp4": ["第3轮-比较"],
+        "merge7.mp4": ["第3轮-缩小范围", "第4轮-计算mid"],
+        "merge8.mp4": ["第4轮-比较", "结束"],
     }
-    
-    # 处理每组视频
-    for output_path, (start_idx, end_idx) in merge_groups.items():
-        print(f"\n处理 {output_path} (索引 {start_idx}-{end_idx})...")
-        selected_videos = video_files[start_idx:end_idx + 1]
-        merge_videos(selected_videos, output_path)
+
+    # 小节名 -> 小节视频（字典查找），旧的序号区间写法才需要片段列表
+    section_index = load_section_index(folder_path)
+    video_files = []
+    if any(isinstance(spec, tuple) for spec in merge_groups.values()):
+        video_files = load_partial_files(folder_path)
+        if not video_files:
+            print("未找到MP4文件！")
+            return
+
+    try:
+        groups = {
+            output_path: resolve_group(spec, video_files, section_index)
+            for output_path, spec in merge_groups.items()
+        }
+    except KeyError as e:
+        print(f"{e.args[0]}（需开启 save_sections 渲染，render_all.py 默认开启）")
+        return
+    except ValueError as e:
+        print(e)
+        return
+
+    # 并行处理各组视频
+    failed = merge_all_groups(groups, args.jobs, stream_copy=not args.reencode, force=args.force)
+    if failed:
+        print(f"\n以下输出合并失败：{', '.join(failed)}")
+
+    rss = peak_rss_mb()
+    if rss is not None:
+        print(f"\n峰值内存：本进程 {rss[0]:.0f} MB，单个 ffmpeg 子进程最多 {rss[1]:.0f} MB")
 
 if __name__ == "__main__":
     main()
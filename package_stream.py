@@ -0,0 +1,176 @@
+"""
+分段流媒体打包（HLS / DASH）
+
+把场景的多分辨率视频（transcode_ladder.py 的输出）打包为分段 HLS，
+并生成每个场景的主播放列表；可选同时输出 DASH 清单。学生只下载实际观看到的分段，
+拖动进度条时也只需请求对应的分段。
+
+多分辨率视频的关键帧已按 GOP_SECONDS 对齐，这里直接复制码流切分（不重新编码），
+各分辨率的分段边界一致，播放器可以在任意分段边界切换清晰度。全部在本地完成。
+
+输出目录结构（默认 media/stream/<场景名>/）：
+    master.m3u8            主播放列表
+    1080p/index.m3u8       各分辨率的播放列表和分段
+    1080p/seg_00000.ts
+    manifest.mpd           DASH 清单（--dash）
+
+用法：
+    python package_stream.py media/videos/list_crud_animation/2160p30/ListCRUDAnimation.mp4
+    python package_stream.py 母版.mp4 -l 1080p 720p 480p --dash
+"""
+import argparse
+import json
+import os
+import subprocess
+
+from render_all import QUALITY_PRESETS
+from transcode_ladder import DEFAULT_LADDER, GOP_SECONDS, probe_video, rung_output_path, transcode_ladder
+
+
+def ladder_outputs(master_path, rungs):
+    """找到母版对应的各分辨率视频，缺少的先一次性转码出来"""
+    outputs = {rung: rung_output_path(master_path, rung) for rung in rungs}
+    missing = [rung for rung, path in outputs.items() if not os.path.exists(path)]
+    if missing:
+        print(f"缺少 {', '.join(missing)}，先从母版转码")
+        outputs.update(transcode_ladder(master_path, missing))
+    # 高于母版分辨率的档位不会被转码出来
+    return {rung: path for rung, path in outputs.items() if os.path.exists(path)}
+
+
+def segment_hls(video_path, rung_dir):
+    """复制码流，切分为 HLS 分段"""
+    os.makedirs(rung_dir, exist_ok=True)
+    subprocess.run(
+        ["ffmpeg", "-y", "-v", "error", "-i", video_path, "-c", "copy",
+         "-f", "hls", "-hls_time", str(GOP_SECONDS), "-hls_playlist_type", "vod",
+         "-hls_segment_filename", os.path.join(rung_dir, "seg_%05d.ts"),
+         os.path.join(rung_dir, "index.m3u8")],
+        check=True
+    )
+
+
+def playlist_bandwidth(rung_dir):
+    """根据分段大小和时长计算 (峰值码率, 平均码率)，单位 bit/s"""
+    durations = []
+    sizes = []
+    with open(os.path.join(rung_dir, "index.m3u8"), encoding="utf-8") as f:
+        duration = None
+        for line in f:
+            line = line.strip()
+            if line.startswith("#EXTINF:"):
+                duration = float(line[len("#EXTINF:"):].split(",")[0])
+            elif line and not line.startswith("#") and duration:
+                durations.append(duration)
+                sizes.append(os.path.getsize(os.path.join(rung_dir, line)))
+                duration = None
+
+    peak = max(size * 8 / duration for size, duration in zip(sizes, durations))
+    average = sum(sizes) * 8 / sum(durations)
+    return int(peak), int(average)
+
+
+# H.264 profile 对应的 RFC 6381 编码名前缀（profile_idc + constraint 标志）
+AVC_PROFILES = {"Constrained Baseline": "42E0", "Baseline": "4200", "Main": "4D40", "High": "6400"}
+
+# AAC profile 对应的 mp4a 对象类型
+AAC_PROFILES = {"LC": "mp4a.40.2", "HE-AAC": "mp4a.40.5", "HE-AACv2": "mp4a.40.29"}
+
+
+def probe_codecs(video_path):
+    """用 ffprobe 生成主播放列表 CODECS 属性的值，例如 avc1.640028,mp4a.40.2"""
+    result = subprocess.run(
+        ["ffprobe", "-v", "error", "-show_entries", "stream=codec_type,codec_name,profile,level",
+         "-of", "json", video_path],
+        capture_output=True, text=True, check=True
+    )
+    codecs = []
+    for stream in json.loads(result.stdout)["streams"]:
+        if stream.get("codec_type") == "video" and stream.get("codec_name") == "h264":
+            prefix = AVC_PROFILES.get(stream.get("profile"), AVC_PROFILES["High"])
+            codecs.append(f"avc1.{prefix}{int(stream.get('level', 40)):02X}")
+        elif stream.get("codec_type") == "audio" and stream.get("codec_name") == "aac":
+            codecs.append(AAC_PROFILES.get(stream.get("profile"), AAC_PROFILES["LC"]))
+    return ",".join(codecs)
+
+
+def write_master_playlist(output_dir, variants):
+    """variants: [(分辨率名, 宽, 高, 峰值码率, 平均码率, CODECS), ...]，按码率从高到低排列"""
+    lines = ["#EXTM3U", "#EXT-X-VERSION:3"]
+    for rung, width, height, peak, average, codecs in sorted(variants, key=lambda v: -v[3]):
+        attributes = f"BANDWIDTH={peak},AVERAGE-BANDWIDTH={average},RESOLUTION={width}x{height}"
+        if codecs:
+            attributes += f',CODECS="{codecs}"'
+        lines.append(f"#EXT-X-STREAM-INF:{attributes}")
+        lines.append(f"{rung}/index.m3u8")
+    master_path = os.path.join(output_dir, "master.m3u8")
+    with open(master_path, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+    return master_path
+
+
+def package_dash(videos, output_dir):
+    """所有分辨率放入同一个 DASH 清单（复制码流，分段时长与 HLS 相同）
+
+    音频与 HLS 一样保留：各分辨率的音轨相同，只取第一个输入的音轨（没有音轨时跳过）。
+    """
+    command = ["ffmpeg", "-y", "-v", "error"]
+    for video in videos:
+        command += ["-i", video]
+    for i in range(len(videos)):
+        command += ["-map", f"{i}:v"]
+    command += ["-map", "0:a?"]
+    command += ["-c", "copy", "-f", "dash", "-seg_duration", str(GOP_SECONDS),
+                "-use_template", "1", "-use_timeline", "1",
+                os.path.join(output_dir, "manifest.mpd")]
+    subprocess.run(command, check=True)
+
+
+def package_scene(master_path, rungs=DEFAULT_LADDER, output_dir=None, dash=False):
+    """打包一个场景，返回主播放列表路径"""
+    scene_name = os.path.splitext(os.path.basename(master_path))[0]
+    output_dir = output_dir or os.path.join("media", "stream", scene_name)
+    os.makedirs(output_dir, exist_ok=True)
+
+    outputs = ladder_outputs(master_path, rungs)
+    variants = []
+    for rung, video in outputs.items():
+        rung_dir = os.path.join(output_dir, rung)
+        segment_hls(video, rung_dir)
+        width, height, _ = probe_video(video)
+        variants.append((rung, width, height, *playlist_bandwidth(rung_dir), probe_codecs(video)))
+
+    master_playlist = write_master_playlist(output_dir, variants)
+    if dash:
+        package_dash(list(outputs.values()), output_dir)
+    return master_playlist
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="把场景视频打包为分段 HLS（可选 DASH）")
+    parser.add_argument("videos", nargs="+", help="场景母版视频路径（各分辨率视频与母版位于同一目录）")
+    parser.add_argument("-l", "--ladder", nargs="+", choices=sorted(QUALITY_PRESETS), default=DEFAULT_LADDER,
+                        help=f"打包的分辨率（默认 {' '.join(DEFAULT_LADDER)}）")
+    parser.add_argument("--dash", action="store_true", help="同时输出 DASH 清单")
+    parser.add_argument("-o", "--output-root", default=os.path.join("media", "stream"),
+                        help="输出根目录，每个场景一个子目录（默认 media/stream）")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    failed = []
+    for video in args.videos:
+        scene_name = os.path.splitext(os.path.basename(video))[0]
+        try:
+            master_playlist = package_scene(video, args.ladder, os.path.join(args.output_root, scene_name), args.dash)
+        except (OSError, ValueError, subprocess.CalledProcessError) as e:
+            failed.append(video)
+            print(f"[失败] {scene_name}：{e}")
+            continue
+        print(f"[完成] {scene_name}：{master_playlist}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
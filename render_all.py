@@ -0,0 +1,289 @@
+"""
+课程动画批量渲染工具
+
+自动发现仓库中所有的 Scene 子类，并使用进程池并行渲染。
+所有场景共用同一个画质预设，不再依赖各文件 __main__ 中写死的分辨率。
+
+用法示例：
+    python render_all.py                      # 使用全部CPU核心，4K渲染所有场景
+    python render_all.py -q 1080p -j 8        # 1080p，8个进程
+    python render_all.py --list               # 只列出发现的场景
+    python render_all.py -s BinarySearchAnimation ListCRUDAnimation
+    python render_all.py --force              # 忽略渲染缓存，强制重新渲染
+    python render_all.py --dry-run            # 不渲染，只估算各场景时长
+    python render_all.py -s ListSlicingAnimation --sections 基本切片   # 只渲染名称包含“基本切片”的小节
+    python render_all.py --compact-waits      # 静态停顿只编码一帧（可变帧率输出）
+"""
+import argparse
+import ast
+import glob
+import json
+import os
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import render_cache
+
+# 画质预设（分辨率与帧率）
+QUALITY_PRESETS = {
+    "2160p": {"pixel_width": 3840, "pixel_height": 2160, "frame_rate": 30},
+    "1440p": {"pixel_width": 2560, "pixel_height": 1440, "frame_rate": 30},
+    "1080p": {"pixel_width": 1920, "pixel_height": 1080, "frame_rate": 30},
+    "720p": {"pixel_width": 1280, "pixel_height": 720, "frame_rate": 30},
+    "480p": {"pixel_width": 854, "pixel_height": 480, "frame_rate": 15},
+}
+DEFAULT_QUALITY = "2160p"
+
+# 视为场景基类的类名
+SCENE_BASES = {"Scene", "MovingCameraScene", "ThreeDScene", "ZoomedScene"}
+
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def find_scene_classes(module_path):
+    """静态解析模块源码，找出其中继承自 Scene 的类（无需导入 manim）"""
+    with open(module_path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=module_path)
+
+    scene_names = []
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        for base in node.bases:
+            base_name = base.attr if isinstance(base, ast.Attribute) else getattr(base, "id", None)
+            if base_name in SCENE_BASES or base_name in scene_names:
+                scene_names.append(node.name)
+                break
+    return scene_names
+
+
+def discover_scenes(project_dir=PROJECT_DIR):
+    """扫描项目目录下的动画文件，返回 [(模块名, 场景类名), ...]"""
+    scenes = []
+    for module_path in sorted(glob.glob(os.path.join(project_dir, "*_animation.py"))):
+        module_name = os.path.splitext(os.path.basename(module_path))[0]
+        for class_name in find_scene_classes(module_path):
+            scenes.append((module_name, class_name))
+    return scenes
+
+
+def section_selected(name, sections):
+    """小节名包含任意一个给定名称即视为选中"""
+    return any(pattern in name for pattern in sections)
+
+
+def merge_section_index(index_path, old_sections):
+    """只渲染部分小节时，manim 写出的小节清单只包含本次渲染的小节；
+    把未重新渲染的小节按原来的顺序补回清单，它们的视频文件仍然有效"""
+    with open(index_path, encoding="utf-8") as f:
+        new_sections = {section["name"]: section for section in json.load(f)}
+
+    merged = [new_sections.pop(section["name"], section) for section in old_sections]
+    merged.extend(new_sections.values())
+    with open(index_path, "w", encoding="utf-8") as f:
+        json.dump(merged, f, ensure_ascii=False, indent=4)
+
+
+def render_scene(module_name, class_name, quality, media_dir, sections=None, compact_waits=False):
+    """在子进程中渲染单个场景，返回 (输出视频路径, 耗时秒数, 渲染的小节名列表)
+
+    sections 不为空时只渲染名称匹配的小节（self.next_section），其余小节跳过动画，
+    只快进场景状态；渲染的小节名列表为空表示没有匹配的小节。
+    compact_waits=True 时静态停顿只编码一帧，渲染结束后再按停顿时长重新拼接（见 compact_waits.py）。
+    """
+    import importlib
+    import sys
+    from manim import tempconfig
+
+    if PROJECT_DIR not in sys.path:
+        sys.path.insert(0, PROJECT_DIR)
+
+    start = time.time()
+    options = dict(QUALITY_PRESETS[quality])
+    # save_sections：按小节输出视频和清单，供 merge_videos 按小节名合并
+    options.update({"media_dir": media_dir, "preview": False, "disable_caching": False, "save_sections": True})
+    if compact_waits:
+        # 停顿片段只有一帧，不能被 manim 的片段缓存复用到普通渲染中
+        options["disable_caching"] = True
+
+    with tempconfig(options):
+        module = importlib.import_module(module_name)
+        scene_class = getattr(module, class_name)
+        scene = scene_class()
+
+        rendered = []
+        if sections:
+            file_writer = scene.renderer.file_writer
+            # 第一个 next_section 之前的内容属于 manim 自动创建的小节，一并跳过
+            file_writer.sections[0].skip_animations = True
+            original_next_section = scene.next_section
+
+            def next_section(name="unnamed", *args, skip_animations=False, **kwargs):
+                selected = section_selected(name, sections)
+                if selected:
+                    rendered.append(name)
+                return original_next_section(name, *args, skip_animations=skip_animations or not selected, **kwargs)
+
+            scene.next_section = next_section
+            index_path = os.path.join(file_writer.sections_output_dir, f"{file_writer.output_name}.json")
+            old_sections = []
+            if os.path.exists(index_path):
+                with open(index_path, encoding="utf-8") as f:
+                    old_sections = json.load(f)
+
+        if compact_waits:
+            import compact_waits as compact
+            recorder = compact.HoldRecorder(scene)
+
+        scene.render()
+        output_path = str(scene.renderer.file_writer.movie_file_path)
+
+        if compact_waits:
+            # 小节清单的时长在这里更新，必须在合并旧清单之前
+            saved_frames = compact.rewrite_outputs(scene, recorder)
+            print(f"{class_name}：{len(recorder.holds)} 个静态停顿，少编码 {saved_frames} 帧")
+
+        if sections and rendered and os.path.exists(index_path):
+            merge_section_index(index_path, old_sections)
+
+    return output_path, time.time() - start, rendered
+
+
+def transcode_rungs(class_name, output_path, ladder, missing_only=False):
+    """把场景输出视频转码为多分辨率；missing_only=True 时只转码还不存在的分辨率"""
+    import transcode_ladder
+
+    if missing_only:
+        ladder = [rung for rung in ladder
+                  if not os.path.exists(transcode_ladder.rung_output_path(output_path, rung))]
+        if not ladder:
+            return
+    outputs = transcode_ladder.transcode_ladder(output_path, ladder)
+    print(f"[转码] {class_name}：{', '.join(outputs) or '无（母版分辨率过低）'}")
+
+
+def render_all(scenes, quality=DEFAULT_QUALITY, jobs=None, media_dir="media", force=False, sections=None,
+               ladder=None, compact_waits=False):
+    """使用进程池并行渲染场景列表，返回失败的场景名列表
+
+    内容哈希未变化且输出视频仍存在的场景会被直接跳过（force=True 时不跳过）。
+    sections 不为空时只渲染名称匹配的小节，不使用也不写入渲染缓存。
+    ladder 不为空时，每个场景渲染完成后把输出视频转码为这些分辨率（见 transcode_ladder.py）；
+    跳过的场景也会补齐缺少的分辨率，不需要为此重新渲染。
+    compact_waits=True 时静态停顿只编码一帧，输出为可变帧率视频（见 compact_waits.py）。
+    """
+    keys = {}
+    pending = []
+    failed = []
+    for module_name, class_name in scenes:
+        render_options = dict(QUALITY_PRESETS[quality], compact_waits=True) if compact_waits else QUALITY_PRESETS[quality]
+        key = render_cache.scene_hash(module_name, class_name, render_options)
+        keys[class_name] = key
+        cached_output = None if force or sections else render_cache.lookup(media_dir, class_name, key)
+        if cached_output:
+            print(f"[跳过] {class_name}（未变化，已有输出 {cached_output}）")
+            if ladder:
+                try:
+                    transcode_rungs(class_name, cached_output, ladder, missing_only=True)
+                except Exception:
+                    failed.append(class_name)
+                    print(f"[失败] {class_name} 转码")
+                    traceback.print_exc()
+        else:
+            pending.append((module_name, class_name))
+
+    if not pending:
+        print("所有场景均未变化，无需渲染")
+        return failed
+    scenes = pending
+
+    jobs = jobs or os.cpu_count() or 1
+    jobs = min(jobs, len(scenes)) or 1
+    print(f"共 {len(scenes)} 个场景，画质 {quality}，并行进程数 {jobs}")
+
+    start = time.time()
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = {
+            executor.submit(render_scene, module_name, class_name, quality, media_dir, sections, compact_waits): class_name
+            for module_name, class_name in scenes
+        }
+        for future in as_completed(futures):
+            class_name = futures[future]
+            try:
+                output_path, elapsed, rendered = future.result()
+                if not sections:
+                    render_cache.store(media_dir, class_name, keys[class_name], output_path)
+                    print(f"[完成] {class_name}（耗时 {elapsed:.1f} 秒）")
+                    if ladder:
+                        transcode_rungs(class_name, output_path, ladder)
+                elif rendered:
+                    # 完整视频此时只包含本次渲染的小节，不能再作为缓存命中的结果
+                    render_cache.discard(media_dir, class_name, output_path)
+                    print(f"[完成] {class_name}：{', '.join(rendered)}（耗时 {elapsed:.1f} 秒）")
+                else:
+                    print(f"[跳过] {class_name}（没有匹配的小节）")
+            except Exception:
+                failed.append(class_name)
+                print(f"[失败] {class_name}")
+                traceback.print_exc()
+
+    print(f"\n全部渲染结束，总耗时 {time.time() - start:.1f} 秒，失败 {len(failed)} 个")
+    return failed
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="并行渲染课程中的所有 Manim 场景")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITY_PRESETS), default=DEFAULT_QUALITY,
+                        help=f"画质预设（默认 {DEFAULT_QUALITY}）")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="并行进程数（默认等于CPU核心数）")
+    parser.add_argument("-s", "--scenes", nargs="+", default=None,
+                        help="只渲染指定的场景类名")
+    parser.add_argument("--media-dir", default="media", help="输出目录（默认 media）")
+    parser.add_argument("--list", action="store_true", help="只列出发现的场景，不渲染")
+    parser.add_argument("--force", action="store_true", help="忽略渲染缓存，强制重新渲染")
+    parser.add_argument("--sections", nargs="+", default=None,
+                        help="只渲染名称包含这些文字的小节（self.next_section），其余小节跳过")
+    parser.add_argument("--ladder", nargs="+", choices=sorted(QUALITY_PRESETS), default=None,
+                        help="渲染完成后把母版一次解码转码为这些分辨率，例如 --ladder 1080p 720p")
+    parser.add_argument("--compact-waits", action="store_true",
+                        help="静态停顿只编码一帧，按停顿时长拼接（输出为可变帧率视频）")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="不渲染，只执行场景并估算总时长和各小节时间线")
+    parser.add_argument("-v", "--verbose", action="store_true", help="--dry-run 时显示每一次 play/wait")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    scenes = discover_scenes()
+    if args.scenes:
+        unknown = set(args.scenes) - {class_name for _, class_name in scenes}
+        if unknown:
+            print(f"未找到场景：{', '.join(sorted(unknown))}")
+            return 1
+        scenes = [scene for scene in scenes if scene[1] in args.scenes]
+
+    if args.list:
+        for module_name, class_name in scenes:
+            print(f"{module_name}.py: {class_name}")
+        return 0
+
+    if not scenes:
+        print("未找到任何场景！")
+        return 1
+
+    if args.dry_run:
+        import scene_timeline
+        _, failed = scene_timeline.estimate_all(scenes, args.verbose)
+        return 1 if failed else 0
+
+    failed = render_all(scenes, args.quality, args.jobs, args.media_dir, args.force, args.sections,
+                        args.ladder, args.compact_waits)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,151 @@
+"""
+场景渲染缓存
+
+根据场景源码（含其依赖的本地模块）、数据、画质参数和所用字体计算内容哈希，
+若该哈希对应的输出视频已经存在，则整段跳过该场景的渲染。
+"""
+import ast
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+
+CACHE_DIR_NAME = "render_cache"
+
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def local_dependencies(module_path, project_dir=PROJECT_DIR, seen=None):
+    """递归找出模块导入的本地模块文件（按路径排序）"""
+    seen = set() if seen is None else seen
+    with open(module_path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=module_path)
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names = [node.module]
+        else:
+            continue
+        for name in names:
+            dep_path = os.path.join(project_dir, name.split(".")[0] + ".py")
+            if os.path.exists(dep_path) and dep_path not in seen:
+                seen.add(dep_path)
+                local_dependencies(dep_path, project_dir, seen)
+    return sorted(seen)
+
+
+def _is_font_name(name):
+    return name == "font" or name.endswith("_font")
+
+
+def collect_fonts(module_path):
+    """收集源码中出现的字体名（font="..."、var_font="..." 参数及其默认值，以及 *_FONT 常量）"""
+    with open(module_path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=module_path)
+
+    fonts = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.keyword) and node.arg and _is_font_name(node.arg):
+            if isinstance(node.value, ast.Constant) and isinstance(node.value.value, str):
+                fonts.add(node.value.value)
+        elif isinstance(node, ast.arguments):
+            # 函数参数的默认字体，如 ArrayStrip(..., var_font="Courier New")
+            positional = node.posonlyargs + node.args
+            pairs = list(zip(positional[len(positional) - len(node.defaults):], node.defaults))
+            pairs += [(arg, default) for arg, default in zip(node.kwonlyargs, node.kw_defaults) if default is not None]
+            for arg, default in pairs:
+                if _is_font_name(arg.arg) and isinstance(default, ast.Constant) and isinstance(default.value, str):
+                    fonts.add(default.value)
+        elif isinstance(node, ast.Assign) and isinstance(node.value, ast.Constant):
+            for target in node.targets:
+                name = target.attr if isinstance(target, ast.Attribute) else getattr(target, "id", "")
+                if name.endswith("FONT") and isinstance(node.value.value, str):
+                    fonts.add(node.value.value)
+    return sorted(fonts)
+
+
+def font_fingerprint(font_name):
+    """用 fc-match 找到字体文件，以 文件路径+大小+修改时间 作为指纹"""
+    if shutil.which("fc-match") is None:
+        return font_name
+    try:
+        font_file = subprocess.run(
+            ["fc-match", "-f", "%{file}", font_name],
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+        stat = os.stat(font_file)
+    except (OSError, subprocess.CalledProcessError):
+        return font_name
+    return f"{font_name}:{font_file}:{stat.st_size}:{int(stat.st_mtime)}"
+
+
+def scene_hash(module_name, class_name, render_options, project_dir=PROJECT_DIR):
+    """计算场景的内容哈希"""
+    module_path = os.path.join(project_dir, module_name + ".py")
+    digest = hashlib.sha256()
+    digest.update(class_name.encode("utf-8"))
+
+    # 场景源码及其依赖的本地模块（场景数据如 self.numbers/self.target 都写在源码中）
+    sources = [module_path] + local_dependencies(module_path, project_dir)
+    for path in sources:
+        with open(path, "rb") as f:
+            digest.update(os.path.basename(path).encode("utf-8"))
+            digest.update(f.read())
+
+    # 分辨率、帧率等渲染参数
+    digest.update(json.dumps(render_options, sort_keys=True).encode("utf-8"))
+
+    # 字体（包括依赖模块中的默认字体，如 ArrayStrip 的 var_font）
+    fonts = sorted({font_name for path in sources for font_name in collect_fonts(path)})
+    for font_name in fonts:
+        digest.update(font_fingerprint(font_name).encode("utf-8"))
+
+    try:
+        import manim
+        digest.update(manim.__version__.encode("utf-8"))
+    except ImportError:
+        pass
+
+    return digest.hexdigest()[:16]
+
+
+def _record_path(media_dir, class_name, key):
+    return os.path.join(media_dir, CACHE_DIR_NAME, f"{class_name}-{key}.json")
+
+
+def lookup(media_dir, class_name, key):
+    """查询缓存，命中时返回已有的输出视频路径，否则返回 None"""
+    record_path = _record_path(media_dir, class_name, key)
+    if not os.path.exists(record_path):
+        return None
+    with open(record_path, encoding="utf-8") as f:
+        output_path = json.load(f).get("output")
+    if output_path and os.path.exists(output_path):
+        return output_path
+    return None
+
+
+def discard(media_dir, class_name, output_path):
+    """删除指向该输出视频的缓存记录（输出内容已被覆盖，不再对应任何哈希）"""
+    cache_dir = os.path.join(media_dir, CACHE_DIR_NAME)
+    os.makedirs(cache_dir, exist_ok=True)
+    for name in os.listdir(cache_dir):
+        if not (name.startswith(class_name + "-") and name.endswith(".json")):
+            continue
+        old_record = os.path.join(cache_dir, name)
+        with open(old_record, encoding="utf-8") as f:
+            if json.load(f).get("output") == output_path:
+                os.remove(old_record)
+
+
+def store(media_dir, class_name, key, output_path):
+    """渲染成功后记录哈希与输出视频的对应关系
+
+    同一输出路径的旧记录会被删除，因为旧内容已被本次渲染覆盖。
+    """
+    discard(media_dir, class_name, output_path)
+    with open(_record_path(media_dir, class_name, key), "w", encoding="utf-8") as f:
+        json.dump({"scene": class_name, "hash": key, "output": output_path}, f, ensure_ascii=False, indent=2)
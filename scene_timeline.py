@@ -0,0 +1,153 @@
+"""
+场景时长估算（不渲染）
+
+以跳过动画的方式执行场景的 construct：每个 play/wait 只计算最终状态，
+不生成任何帧、不写视频文件，因此每个场景只需几秒。
+记录每一次 play/wait 的开始时间和时长，按小节（self.next_section）汇总，
+用于在 4K 渲染之前对照 PPT_COURSE_OUTLINE.md 检查各部分时长。
+
+用法：
+    python scene_timeline.py                        # 估算所有场景
+    python scene_timeline.py ListCRUDAnimation -v   # 显示每一次 play/wait
+    python render_all.py --dry-run                  # 同上，使用 render_all 的场景筛选参数
+"""
+import argparse
+import importlib
+import os
+import sys
+import time
+from collections import namedtuple
+
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# 场景中的一次 play/wait 调用
+TimelineEntry = namedtuple("TimelineEntry", ["section", "kind", "start", "duration", "description"])
+
+# 未调用 next_section 之前的默认小节名
+DEFAULT_SECTION = "（默认）"
+
+
+def format_time(seconds):
+    """秒数格式化为 MM:SS.s"""
+    minutes, seconds = divmod(seconds, 60)
+    return f"{int(minutes):02d}:{seconds:04.1f}"
+
+
+def _describe(animations):
+    names = [type(animation).__name__ for animation in animations]
+    if len(names) > 3:
+        return ", ".join(names[:3]) + f" 等 {len(names)} 个"
+    return ", ".join(names)
+
+
+def estimate_scene(module_name, class_name):
+    """不渲染地执行场景，返回 [TimelineEntry, ...]"""
+    from manim import tempconfig, Wait
+
+    if PROJECT_DIR not in sys.path:
+        sys.path.insert(0, PROJECT_DIR)
+
+    entries = []
+    with tempconfig({"dry_run": True, "disable_caching": True, "preview": False}):
+        module = importlib.import_module(module_name)
+        scene_class = getattr(module, class_name)
+        # skip_animations=True：每个动画直接跳到结束状态，renderer.time 仍按 run_time 累加
+        scene = scene_class(skip_animations=True)
+
+        state = {"section": DEFAULT_SECTION}
+        original_play = scene.play
+        original_next_section = scene.next_section
+
+        def play(*args, **kwargs):
+            start = scene.renderer.time
+            original_play(*args, **kwargs)
+            animations = scene.animations or []
+            kind = "wait" if len(animations) == 1 and isinstance(animations[0], Wait) else "play"
+            entries.append(TimelineEntry(
+                state["section"], kind, start, scene.renderer.time - start,
+                "" if kind == "wait" else _describe(animations)
+            ))
+
+        def next_section(name="unnamed", *args, **kwargs):
+            state["section"] = name
+            return original_next_section(name, *args, **kwargs)
+
+        # wait() 内部也是调用 self.play(Wait(...))，所以只需替换 play
+        scene.play = play
+        scene.next_section = next_section
+        scene.render()
+
+    return entries
+
+
+def summarize_sections(entries):
+    """按出现顺序汇总各小节，返回 [(小节名, 开始时间, 时长, play 次数, wait 时长), ...]"""
+    sections = {}
+    for entry in entries:
+        if entry.section not in sections:
+            sections[entry.section] = [entry.start, 0.0, 0, 0.0]
+        summary = sections[entry.section]
+        summary[1] += entry.duration
+        if entry.kind == "wait":
+            summary[3] += entry.duration
+        else:
+            summary[2] += 1
+    return [(name, *values) for name, values in sections.items()]
+
+
+def print_timeline(class_name, entries, elapsed, verbose=False):
+    total = sum(entry.duration for entry in entries)
+    print(f"\n{class_name}：总时长 {format_time(total)}（{total:.1f} 秒，估算耗时 {elapsed:.1f} 秒）")
+    for name, start, duration, plays, wait_time in summarize_sections(entries):
+        print(f"  [{format_time(start)}] {name}：{format_time(duration)}，"
+              f"{plays} 次 play，停顿 {wait_time:.1f} 秒")
+        if verbose:
+            for entry in entries:
+                if entry.section == name:
+                    label = entry.description or "wait"
+                    print(f"      {format_time(entry.start)}  {entry.kind:<4} {entry.duration:5.2f}s  {label}")
+    return total
+
+
+def estimate_all(scenes, verbose=False):
+    """估算场景列表的时长，返回 (总时长, 失败的场景名列表)"""
+    import traceback
+
+    grand_total = 0.0
+    failed = []
+    for module_name, class_name in scenes:
+        start = time.time()
+        try:
+            entries = estimate_scene(module_name, class_name)
+        except Exception:
+            failed.append(class_name)
+            print(f"[失败] {class_name}")
+            traceback.print_exc()
+            continue
+        grand_total += print_timeline(class_name, entries, time.time() - start, verbose)
+
+    print(f"\n共 {len(scenes)} 个场景，合计时长 {format_time(grand_total)}（约 {grand_total / 60:.1f} 分钟）")
+    return grand_total, failed
+
+
+def main(argv=None):
+    from render_all import discover_scenes
+
+    parser = argparse.ArgumentParser(description="不渲染地估算场景时长")
+    parser.add_argument("scenes", nargs="*", help="场景类名（默认全部）")
+    parser.add_argument("-v", "--verbose", action="store_true", help="显示每一次 play/wait")
+    args = parser.parse_args(argv)
+
+    scenes = discover_scenes()
+    if args.scenes:
+        scenes = [scene for scene in scenes if scene[1] in args.scenes]
+    if not scenes:
+        print("未找到任何场景！")
+        return 1
+
+    _, failed = estimate_all(scenes, args.verbose)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,135 @@
+"""
+查找算法的步骤轨迹（不依赖 manim）
+
+把二分查找、线性查找、峰值查找的算法过程写成纯 Python 生成器，
+逐步产出 SearchEvent 事件，动画场景只负责把事件画出来。
+这样可以在不渲染的情况下快速验证大量输入。
+
+事件类型（kind）：
+    "mid"        计算出新的 mid（low, mid, high 为当前范围）
+    "visit"      线性查找访问第 index 个元素
+    "compare"    比较 list[index] 与目标值，op 为 "==" / "<" / ">"
+    "move_low"   low 移动到 mid + 1（low 为移动后的值）
+    "move_high"  high 移动到 mid - 1（峰值查找中为 mid）
+    "miss"       线性查找中当前元素不是目标值
+    "found"      找到目标，位于 index
+    "not_found"  查找结束，未找到目标
+
+用法：
+    python search_trace.py      # 用随机输入与标准库 bisect 对拍
+"""
+import bisect
+import random
+from collections import namedtuple
+
+SearchEvent = namedtuple(
+    "SearchEvent",
+    ["kind", "low", "mid", "high", "index", "value", "op"],
+    defaults=(None,) * 6
+)
+
+
+def compare_op(value, target):
+    """返回 value 与 target 的比较符号"""
+    if value == target:
+        return "=="
+    return "<" if value < target else ">"
+
+
+def binary_search_trace(numbers, target):
+    """二分查找轨迹（与 BinarySearchAnimation 的循环一致）"""
+    low, high = 0, len(numbers) - 1
+    while low <= high:
+        mid = (low + high) // 2
+        yield SearchEvent("mid", low=low, mid=mid, high=high)
+
+        value = numbers[mid]
+        op = compare_op(value, target)
+        yield SearchEvent("compare", low=low, mid=mid, high=high, index=mid, value=value, op=op)
+
+        if op == "==":
+            yield SearchEvent("found", low=low, mid=mid, high=high, index=mid, value=value)
+            return
+        if op == "<":
+            low = mid + 1
+            yield SearchEvent("move_low", low=low, mid=mid, high=high)
+        else:
+            high = mid - 1
+            yield SearchEvent("move_high", low=low, mid=mid, high=high)
+
+    yield SearchEvent("not_found", low=low, high=high)
+
+
+def linear_search_trace(numbers, target):
+    """线性查找轨迹（与 LinearSearchAnimation 的循环一致）"""
+    for i, value in enumerate(numbers):
+        yield SearchEvent("visit", index=i)
+
+        op = compare_op(value, target)
+        yield SearchEvent("compare", index=i, value=value, op=op)
+
+        if op == "==":
+            yield SearchEvent("found", index=i, value=value)
+            return
+        yield SearchEvent("miss", index=i, value=value)
+
+    yield SearchEvent("not_found")
+
+
+def peak_trace(arr, low=0, high=None):
+    """峰值查找轨迹：比较 arr[mid] 与 arr[mid + 1]，向较大的一侧收缩
+
+    compare 事件中 value 为 arr[mid]，op 为 arr[mid] 与 arr[mid + 1] 的比较符号。
+    """
+    high = len(arr) - 1 if high is None else high
+    while low < high:
+        mid = (low + high) // 2
+        yield SearchEvent("mid", low=low, mid=mid, high=high)
+
+        op = compare_op(arr[mid], arr[mid + 1])
+        yield SearchEvent("compare", low=low, mid=mid, high=high, index=mid, value=arr[mid], op=op)
+
+        if op == "<":
+            low = mid + 1
+            yield SearchEvent("move_low", low=low, mid=mid, high=high)
+        else:
+            high = mid
+            yield SearchEvent("move_high", low=low, mid=mid, high=high)
+
+    yield SearchEvent("found", low=low, high=high, index=low, value=arr[low])
+
+
+def result_of(events):
+    """从轨迹中取出结果索引，未找到返回 -1"""
+    for event in events:
+        if event.kind == "found":
+            return event.index
+    return -1
+
+
+def validate(trials=1000, seed=0):
+    """用随机输入验证轨迹结果，返回验证的输入个数"""
+    rng = random.Random(seed)
+    for _ in range(trials):
+        numbers = sorted(rng.sample(range(1000), rng.randint(0, 40)))
+        target = rng.randrange(1000)
+
+        expected = bisect.bisect_left(numbers, target)
+        if expected == len(numbers) or numbers[expected] != target:
+            expected = -1
+        assert result_of(binary_search_trace(numbers, target)) == expected, (numbers, target)
+        assert result_of(linear_search_trace(numbers, target)) == expected, (numbers, target)
+
+        # 峰值查找：结果必须是局部最大值（相邻元素互不相等）
+        arr = rng.sample(range(1000), rng.randint(1, 40))
+        peak = result_of(peak_trace(arr))
+        assert (peak == 0 or arr[peak] > arr[peak - 1]) and (peak == len(arr) - 1 or arr[peak] > arr[peak + 1]), arr
+    return trials
+
+
+if __name__ == "__main__":
+    import time
+
+    start = time.time()
+    count = validate()
+    print(f"已验证 {count} 组随机输入，耗时 {(time.time() - start) * 1000:.0f} 毫秒")
@@ -0,0 +1,117 @@
+"""
+按 PPT 页导出视频片段
+
+slides.json 记录每一页 PPT 使用哪个场景的哪些小节（self.next_section 的名称），
+对应 PPT_COURSE_OUTLINE.md 中“截取……部分”的说明。本工具直接把渲染好的小节视频
+无损拼接成每页一个片段，不需要在剪辑软件里手工截取，也不会重新编码。
+
+小节视频由 render_all.py 渲染时生成（已开启 save_sections）。
+
+用法：
+    python slide_clips.py                   # 导出全部页面（2160p）
+    python slide_clips.py -q 1080p -p 4 5   # 只导出第4、5页的 1080p 片段
+"""
+import argparse
+import json
+import os
+
+from merge_videos import concat_copy
+from render_all import QUALITY_PRESETS, DEFAULT_QUALITY, PROJECT_DIR
+
+DEFAULT_MAPPING = os.path.join(PROJECT_DIR, "slides.json")
+
+
+def load_slides(mapping_path=DEFAULT_MAPPING):
+    with open(mapping_path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def sections_dir(media_dir, module_name, quality):
+    """manim 的小节视频目录：media/videos/<模块名>/<分辨率p帧率>/sections"""
+    preset = QUALITY_PRESETS[quality]
+    quality_dir = f"{preset['pixel_height']}p{preset['frame_rate']:g}"
+    return os.path.join(media_dir, "videos", module_name, quality_dir, "sections")
+
+
+def load_section_videos(media_dir, module_name, scene_name, quality):
+    """读取场景的小节清单，返回按播放顺序排列的 [(小节名, 视频路径), ...]"""
+    directory = sections_dir(media_dir, module_name, quality)
+    with open(os.path.join(directory, scene_name + ".json"), encoding="utf-8") as f:
+        sections = json.load(f)
+    return [(section["name"], os.path.join(directory, section["video"])) for section in sections]
+
+
+def slide_videos(slide, section_videos):
+    """一页 PPT 需要拼接的小节视频；sections 为 null 时使用整个场景"""
+    if slide["sections"] is None:
+        return [video for _, video in section_videos]
+
+    videos = dict(section_videos)
+    missing = [name for name in slide["sections"] if name not in videos]
+    if missing:
+        raise ValueError(f"场景 {slide['scene']} 中没有小节：{', '.join(missing)}")
+    return [videos[name] for name in slide["sections"]]
+
+
+def clip_name(slide):
+    return f"slide_{slide['slide']:02d}_{slide['title']}.mp4"
+
+
+def export_slides(slides, quality=DEFAULT_QUALITY, media_dir="media", output_dir=None):
+    """为每一页导出一个片段，返回失败的页码列表"""
+    output_dir = output_dir or os.path.join(media_dir, "slides", quality)
+    os.makedirs(output_dir, exist_ok=True)
+
+    section_cache = {}
+    failed = []
+    for slide in slides:
+        key = (slide["module"], slide["scene"])
+        if key not in section_cache:
+            try:
+                section_cache[key] = load_section_videos(media_dir, slide["module"], slide["scene"], quality)
+            except FileNotFoundError:
+                section_cache[key] = None
+        if section_cache[key] is None:
+            failed.append(slide["slide"])
+            print(f"[失败] 第{slide['slide']}页：未找到 {slide['scene']} 的 {quality} 小节清单，"
+                  f"请先运行 python render_all.py -q {quality} -s {slide['scene']}")
+            continue
+
+        try:
+            videos = slide_videos(slide, section_cache[key])
+            output_path = os.path.join(output_dir, clip_name(slide))
+            concat_copy(videos, output_path)
+            print(f"[完成] 第{slide['slide']}页：{output_path}（{len(videos)} 个小节）")
+        except Exception as e:
+            failed.append(slide["slide"])
+            print(f"[失败] 第{slide['slide']}页：{e}")
+    return failed
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="按 PPT 页把小节视频导出为片段（不重新编码）")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITY_PRESETS), default=DEFAULT_QUALITY,
+                        help=f"画质预设（默认 {DEFAULT_QUALITY}），需与渲染时一致")
+    parser.add_argument("-p", "--pages", type=int, nargs="+", default=None, help="只导出指定页码")
+    parser.add_argument("--mapping", default=DEFAULT_MAPPING, help="页面与小节的对应关系（默认 slides.json）")
+    parser.add_argument("--media-dir", default="media", help="渲染输出目录（默认 media）")
+    parser.add_argument("-o", "--output-dir", default=None, help="片段输出目录（默认 media/slides/<画质>）")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    slides = load_slides(args.mapping)
+    if args.pages:
+        slides = [slide for slide in slides if slide["slide"] in args.pages]
+    if not slides:
+        print("没有需要导出的页面！")
+        return 1
+
+    failed = export_slides(slides, args.quality, args.media_dir, args.output_dir)
+    print(f"\n共 {len(slides)} 页，失败 {len(failed)} 页")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
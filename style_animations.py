@@ -0,0 +1,232 @@
+"""
+轻量级样式动画
+
+`.animate` 会为每个对象复制一份目标对象，标记一整段元素时（例如
+mark_skipped_range）会同时产生几十个动画和几十份深拷贝。
+这里的动画直接在原对象上插值样式数组，不复制对象：
+所有受影响子对象的颜色数组拼接成一个 NumPy 数组，每帧只做一次向量运算。
+
+常用写法对照：
+    squares[i].animate.set_stroke(color=C, width=4)  ->  SetStroke(squares[i], color=C, width=4)
+    text[i].animate.set_color(C)                     ->  SetColor(text[i], C)
+    text[i].animate.set_color(C).scale(1.3)          ->  SetColor(text[i], C, scale=1.3)
+    text[i].animate.set_opacity(0.3)                 ->  SetOpacity(text[i], 0.3)
+    text[i].animate.scale(1.3)                       ->  ScaleBy(text[i], 1.3)
+"""
+from manim import *
+from collections import namedtuple
+from types import SimpleNamespace
+import numpy as np
+
+# 一组对象的目标样式，值为 None 的属性保持不变
+StyleTarget = namedtuple(
+    "StyleTarget",
+    ["mobjects", "fill_color", "fill_opacity", "stroke_color", "stroke_opacity", "stroke_width", "scale"],
+    defaults=(None,) * 6
+)
+
+
+def _as_list(mobjects):
+    if isinstance(mobjects, Mobject):
+        return [mobjects]
+    return list(mobjects)
+
+
+class BatchedStyle(Animation):
+    """批量插值多组对象的颜色、不透明度、描边宽度和缩放
+
+    用法：
+        self.play(BatchedStyle(
+            StyleTarget(squares[2:8], stroke_opacity=0.3),
+            StyleTarget(numbers_text[2:8], fill_opacity=0.3, stroke_opacity=0.3),
+        ))
+
+    lag_ratio 作用于各个 StyleTarget 之间（与 AnimationGroup 相同）。
+    缩放以每个对象自身的中心为基准，与 .animate.scale() 一致。
+    """
+    def __init__(self, *targets, **kwargs):
+        self.targets = targets
+        mobjects = [mob for target in targets for mob in _as_list(target.mobjects)]
+        # 只有一个对象时直接作用于它，不额外包一层 VGroup（保持对象在场景中的层级）；
+        # 多个对象时的临时 VGroup 在动画开始前就从场景中移除，见 _setup_scene
+        self._wrapper = len(mobjects) != 1
+        self._members = mobjects
+        mobject = mobjects[0] if len(mobjects) == 1 else VGroup(*mobjects)
+        super().__init__(mobject, **kwargs)
+
+    def create_starting_mobject(self):
+        # 起始状态直接保存在数组中，不需要复制对象
+        return Mobject()
+
+    def begin(self):
+        self._fill = self._collect("fill_rgbas", "fill_color", "fill_opacity")
+        self._stroke = self._collect("stroke_rgbas", "stroke_color", "stroke_opacity")
+
+        width_leaves, width_start, width_end, width_target_idx = [], [], [], []
+        for target_idx, target in enumerate(self.targets):
+            if target.stroke_width is None:
+                continue
+            for leaf in self._leaves(target):
+                width_leaves.append(leaf)
+                width_start.append(leaf.get_stroke_width())
+                width_end.append(target.stroke_width)
+                width_target_idx.append(target_idx)
+        self._width = (
+            width_leaves,
+            np.array(width_start, dtype=float),
+            np.array(width_end, dtype=float),
+            np.array(width_target_idx, dtype=int),
+        )
+
+        # 缩放：记录原始点坐标和各对象的中心，每帧按比例重新计算
+        scale_leaves, scale_slices, points, centers, factors, scale_target_idx = [], [], [], [], [], []
+        row = 0
+        for target_idx, target in enumerate(self.targets):
+            if target.scale is None:
+                continue
+            for mob in _as_list(target.mobjects):
+                center = mob.get_center()
+                for leaf in mob.family_members_with_points():
+                    scale_leaves.append(leaf)
+                    scale_slices.append((row, row + len(leaf.points)))
+                    points.append(leaf.points.copy())
+                    centers.append(np.repeat([center], len(leaf.points), axis=0))
+                    factors.append(np.full(len(leaf.points), target.scale, dtype=float))
+                    scale_target_idx.append(np.full(len(leaf.points), target_idx, dtype=int))
+                    row += len(leaf.points)
+        if scale_leaves:
+            self._scale = (
+                scale_leaves, scale_slices, np.concatenate(points), np.concatenate(centers),
+                np.concatenate(factors), np.concatenate(scale_target_idx)
+            )
+        else:
+            self._scale = ([], [], None, None, None, None)
+
+        super().begin()
+
+    def _setup_scene(self, scene):
+        """Scene.play 会把临时 VGroup 加到场景顶层，这里换回各个成员本身
+
+        1. 只从顶层列表移除 VGroup 自身（scene.remove 会把成员也从各自的父对象组中拆出来）；
+        2. 还不在场景中的成员（如预先创建、尚未显示的标记）加入场景并一直保留，与 .animate 相同；
+        3. 按成员在场景中原来的位置重新划分每帧重绘的对象，播放期间层级不变。
+        """
+        super()._setup_scene(scene)
+        if not self._wrapper:
+            return
+        scene.mobjects = [mob for mob in scene.mobjects if mob is not self.mobject]
+        family = scene.get_mobject_family_members()
+        missing = [mob for mob in self._members if all(mob is not member for member in family)]
+        if missing:
+            scene.add(*missing)
+
+        animated = []
+        for animation in scene.animations or []:
+            if isinstance(animation, BatchedStyle) and animation._wrapper:
+                animated.extend(animation._members)
+            else:
+                animated.append(animation.mobject)
+        scene.moving_mobjects, scene.static_mobjects = scene.get_moving_and_static_mobjects(
+            [SimpleNamespace(mobject=mob) for mob in animated]
+        )
+
+    @staticmethod
+    def _leaves(target):
+        for mob in _as_list(target.mobjects):
+            yield from mob.family_members_with_points()
+
+    def _collect(self, array_name, color_name, opacity_name):
+        """把所有受影响子对象的颜色数组拼接起来，返回 (子对象, 切片, 起始数组, 目标数组, 行所属目标)"""
+        leaves, slices, starts, ends, target_rows = [], [], [], [], []
+        row = 0
+        for target_idx, target in enumerate(self.targets):
+            color = getattr(target, color_name)
+            opacity = getattr(target, opacity_name)
+            if color is None and opacity is None:
+                continue
+            rgb = None if color is None else np.array(color_to_rgb(color), dtype=float)
+            for leaf in self._leaves(target):
+                rgbas = np.array(getattr(leaf, array_name), dtype=float).reshape(-1, 4)
+                end = rgbas.copy()
+                if rgb is not None:
+                    end[:, :3] = rgb
+                if opacity is not None:
+                    end[:, 3] = opacity
+                leaves.append(leaf)
+                slices.append((row, row + len(rgbas)))
+                starts.append(rgbas)
+                ends.append(end)
+                target_rows.append(np.full(len(rgbas), target_idx, dtype=int))
+                row += len(rgbas)
+
+        if not leaves:
+            return leaves, slices, np.zeros((0, 4)), np.zeros((0, 4)), np.zeros(0, dtype=int)
+        return leaves, slices, np.concatenate(starts), np.concatenate(ends), np.concatenate(target_rows)
+
+    def _target_alphas(self, alpha):
+        """每个 StyleTarget 的插值进度（按 lag_ratio 错开，并应用 rate_func）"""
+        count = len(self.targets)
+        full_length = (count - 1) * self.lag_ratio + 1
+        return np.array([
+            self.rate_func(float(np.clip(alpha * full_length - i * self.lag_ratio, 0, 1)))
+            for i in range(count)
+        ])
+
+    def interpolate_mobject(self, alpha):
+        alphas = self._target_alphas(alpha)
+
+        for array_name, (leaves, slices, start, end, target_idx) in (
+            ("fill_rgbas", self._fill),
+            ("stroke_rgbas", self._stroke),
+        ):
+            if not leaves:
+                continue
+            values = start + (end - start) * alphas[target_idx][:, None]
+            for leaf, (a, b) in zip(leaves, slices):
+                setattr(leaf, array_name, values[a:b])
+
+        leaves, start, end, target_idx = self._width
+        if leaves:
+            widths = start + (end - start) * alphas[target_idx]
+            for leaf, width in zip(leaves, widths):
+                leaf.stroke_width = width
+
+        leaves, slices, points, centers, factors, target_idx = self._scale
+        if leaves:
+            current = 1 + (factors - 1) * alphas[target_idx]
+            new_points = centers + (points - centers) * current[:, None]
+            for leaf, (a, b) in zip(leaves, slices):
+                leaf.points = new_points[a:b]
+
+
+class SetStroke(BatchedStyle):
+    """就地改变描边颜色/宽度/不透明度，等价于 mob.animate.set_stroke(...)"""
+    def __init__(self, mobject, color=None, width=None, opacity=None, **kwargs):
+        super().__init__(
+            StyleTarget(mobject, stroke_color=color, stroke_width=width, stroke_opacity=opacity),
+            **kwargs
+        )
+
+
+class SetColor(BatchedStyle):
+    """就地改变填充和描边颜色，可同时缩放，等价于 mob.animate.set_color(color).scale(scale)"""
+    def __init__(self, mobject, color, scale=None, **kwargs):
+        super().__init__(
+            StyleTarget(mobject, fill_color=color, stroke_color=color, scale=scale),
+            **kwargs
+        )
+
+
+class SetOpacity(BatchedStyle):
+    """就地改变填充和描边不透明度，等价于 mob.animate.set_opacity(opacity)"""
+    def __init__(self, mobject, opacity, **kwargs):
+        super().__init__(
+            StyleTarget(mobject, fill_opacity=opacity, stroke_opacity=opacity),
+            **kwargs
+        )
+
+
+class ScaleBy(BatchedStyle):
+    """以对象中心为基准就地缩放，等价于 mob.animate.scale(factor)"""
+    def __init__(self, mobject, factor, **kwargs):
+        super().__init__(StyleTarget(mobject, scale=factor), **kwargs)
@@ -0,0 +1,120 @@
+"""
+多分辨率输出
+
+Cairo 光栅化是渲染中最耗时的一步，每个场景只应以母版分辨率渲染一次。
+本工具把母版视频在一次解码中同时缩放、编码成多个分辨率（ffmpeg split 滤镜，多路输出），
+不再为 1080p、720p 副本重新渲染场景。
+
+各分辨率使用相同的关键帧间隔（每 GOP_SECONDS 秒强制一个关键帧，且不插入场景切换关键帧），
+分段打包（HLS/DASH）时各路的分段边界可以对齐。
+
+用法：
+    python transcode_ladder.py media/videos/list_crud_animation/2160p30/ListCRUDAnimation.mp4
+    python transcode_ladder.py 母版.mp4 -l 1080p 720p -o media/ladder
+    python render_all.py --ladder 1080p 720p 480p    # 渲染完成后自动转码
+"""
+import argparse
+import json
+import os
+import subprocess
+
+from render_all import QUALITY_PRESETS
+
+DEFAULT_LADDER = ["2160p", "1080p", "720p", "480p"]
+
+# 关键帧间隔（秒）
+GOP_SECONDS = 2
+
+# x264 质量参数（数值越小质量越高）
+CRF = 20
+
+
+def probe_video(video_path):
+    """返回母版视频的 (宽, 高, 帧率)"""
+    result = subprocess.run(
+        ["ffprobe", "-v", "error", "-select_streams", "v:0",
+         "-show_entries", "stream=width,height,r_frame_rate", "-of", "json", video_path],
+        capture_output=True, text=True, check=True
+    )
+    stream = json.loads(result.stdout)["streams"][0]
+    numerator, denominator = stream["r_frame_rate"].split("/")
+    return stream["width"], stream["height"], float(numerator) / float(denominator)
+
+
+def rung_output_path(master_path, rung, output_dir=None):
+    """ListCRUDAnimation.mp4 -> ListCRUDAnimation_1080p.mp4"""
+    stem = os.path.splitext(os.path.basename(master_path))[0]
+    return os.path.join(output_dir or os.path.dirname(master_path), f"{stem}_{rung}.mp4")
+
+
+def ladder_command(master_path, rungs, master_fps, output_dir=None):
+    """一次解码、多路输出的 ffmpeg 命令，返回 (命令, {分辨率: 输出路径})
+
+    帧率取母版和画质预设中较小的一个。
+    """
+    filters = [f"[0:v]split={len(rungs)}" + "".join(f"[in{i}]" for i in range(len(rungs)))]
+    output_args = []
+    outputs = {}
+    for i, rung in enumerate(rungs):
+        preset = QUALITY_PRESETS[rung]
+        fps = min(master_fps, preset["frame_rate"])
+        filters.append(f"[in{i}]scale=-2:{preset['pixel_height']}:flags=lanczos,fps={fps:g}[out{i}]")
+
+        outputs[rung] = rung_output_path(master_path, rung, output_dir)
+        output_args += [
+            "-map", f"[out{i}]", "-map", "0:a?",
+            "-c:v", "libx264", "-crf", str(CRF), "-preset", "medium", "-pix_fmt", "yuv420p",
+            # 按时间强制关键帧，各路帧率不同时关键帧也在同一时刻
+            "-force_key_frames", f"expr:gte(t,n_forced*{GOP_SECONDS})",
+            "-sc_threshold", "0",
+            "-c:a", "aac", "-movflags", "+faststart",
+            outputs[rung],
+        ]
+
+    command = ["ffmpeg", "-y", "-v", "error", "-i", master_path, "-filter_complex", ";".join(filters)]
+    return command + output_args, outputs
+
+
+def transcode_ladder(master_path, rungs=DEFAULT_LADDER, output_dir=None):
+    """把母版视频转码为多个分辨率，返回 {分辨率: 输出路径}
+
+    高于母版分辨率的档位会被跳过（放大没有意义）。
+    """
+    _, height, fps = probe_video(master_path)
+    rungs = [rung for rung in rungs if QUALITY_PRESETS[rung]["pixel_height"] <= height]
+    if not rungs:
+        return {}
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+
+    command, outputs = ladder_command(master_path, rungs, fps, output_dir)
+    subprocess.run(command, check=True)
+    return outputs
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="一次解码，把母版视频转码为多个分辨率")
+    parser.add_argument("videos", nargs="+", help="母版视频路径")
+    parser.add_argument("-l", "--ladder", nargs="+", choices=sorted(QUALITY_PRESETS), default=DEFAULT_LADDER,
+                        help=f"输出分辨率（默认 {' '.join(DEFAULT_LADDER)}）")
+    parser.add_argument("-o", "--output-dir", default=None, help="输出目录（默认与母版相同）")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    failed = []
+    for video in args.videos:
+        try:
+            outputs = transcode_ladder(video, args.ladder, args.output_dir)
+        except (OSError, subprocess.CalledProcessError) as e:
+            failed.append(video)
+            print(f"[失败] {video}：{e}")
+            continue
+        for rung, output_path in outputs.items():
+            print(f"[完成] {rung}：{output_path}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())